@@ -1,24 +1,50 @@
 """
 Minority Report — Gesture-based cursor control
 """
+import importlib
 
 __version__ = "2.0.0"
 __author__ = "HandControl Team"
 __description__ = "Gesture-based cursor control using computer vision — Minority Report edition"
 
-try:
-    from config import Config
-    from cursor_control import CursorController
-    from gesture_recognition import GestureRecognizer, GestureType
-    from keyboard_mode import KeyboardMode
-    from smoothing import PointSmoother, OneEuroFilter, EMAFilter
-    from hand_tracker import HandTracker, HandLandmarks, HandTrackingResult
-    from calibration import ScreenCalibrator
-except (ImportError, NameError):
-    pass
+# Lazy attribute map (PEP 562): importing the package stays cheap because
+# cv2/mediapipe/pyautogui are only loaded on first attribute access.
+_LAZY_IMPORTS = {
+    'Config': 'config',
+    'CursorController': 'cursor_control',
+    'GestureRecognizer': 'gesture_recognition',
+    'GestureType': 'gesture_recognition',
+    'KeyboardMode': 'keyboard_mode',
+    'PointSmoother': 'smoothing',
+    'OneEuroFilter': 'smoothing',
+    'EMAFilter': 'smoothing',
+    'HandTracker': 'hand_tracker',
+    'HandLandmarks': 'hand_tracker',
+    'HandTrackingResult': 'hand_tracker',
+    'ScreenCalibrator': 'calibration',
+}
 
 __all__ = [
     'Config', 'CursorController', 'GestureRecognizer', 'GestureType',
     'KeyboardMode', 'PointSmoother', 'OneEuroFilter', 'EMAFilter',
     'HandTracker', 'HandLandmarks', 'HandTrackingResult', 'ScreenCalibrator',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        try:
+            module = importlib.import_module(_LAZY_IMPORTS[name])
+        except (ImportError, NameError):
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} "
+                f"(missing optional dependency)"
+            )
+        obj = getattr(module, name)
+        globals()[name] = obj  # Cache so __getattr__ runs once per name
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(list(globals()) + __all__))
@@ -3,7 +3,6 @@ Minority Report CLI entry point
 python -m handcontrol [--calibrate] [--no-preview] [--config PATH]
 """
 import sys
-import argparse
 import os
 
 
@@ -17,6 +16,17 @@ def create_default_config():
 
 
 def main():
+    # Fast path: trivial flags shouldn't pay for full parser construction
+    # (or any heavy imports pulled in by the modules below).
+    argv = sys.argv[1:]
+    if argv == ['--version']:
+        print('Minority Report 2.0.0')
+        return 0
+    if argv == ['--create-config']:
+        create_default_config()
+        return 0
+
+    import argparse
     parser = argparse.ArgumentParser(
         description='Minority Report — Gesture-based cursor control',
         formatter_class=argparse.RawDescriptionHelpFormatter,
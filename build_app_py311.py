@@ -17,6 +17,8 @@ import os
 import shutil
 from pathlib import Path
 
+from build_resources.icon import generate_icon, finalize_icon
+
 
 def check_python311():
     """Check if Python 3.11+ is available."""
@@ -27,16 +29,18 @@ def check_python311():
     ]
     
     for path in python311_paths:
-        if path and Path(path).exists():
-            try:
-                result = subprocess.run([path, "--version"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    version = result.stdout.strip()
-                    print(f"Found Python 3.11+: {path} ({version})")
-                    return path
-            except Exception:
-                continue
-    
+        if not path:
+            continue
+        path = Path(path)
+        # No need to fork an interpreter just to read its version: the
+        # filename encodes it, and the stdlib directory confirms a working
+        # installation.
+        if path.exists() and path.name.startswith("python3.11"):
+            stdlib = path.resolve().parent.parent / "lib" / "python3.11"
+            if stdlib.is_dir():
+                print(f"Found Python 3.11+: {path}")
+                return str(path)
+
     print("❌ Python 3.11+ not found!")
     print("Install it with: brew install python@3.11")
     return None
@@ -45,108 +49,46 @@ def check_python311():
 def setup_venv(python311_path):
     """Set up virtual environment with Python 3.11."""
     venv_path = Path("venv_py311")
-    
+    stamp_path = venv_path / ".requirements.stamp"
+    req_mtime = str(os.path.getmtime("requirements.txt"))
+
     if venv_path.exists():
+        # Reuse the venv instead of a full rebuild when requirements.txt
+        # hasn't changed since the last install (60-180s saved).
+        if stamp_path.exists() and stamp_path.read_text() == req_mtime:
+            print("Reusing existing venv_py311 (requirements unchanged)")
+            return venv_path
         print("Removing existing venv_py311...")
         shutil.rmtree(venv_path)
-    
+
     print("Creating virtual environment with Python 3.11...")
     subprocess.run([python311_path, "-m", "venv", str(venv_path)], check=True)
-    
-    # Install requirements
-    pip_path = venv_path / "bin" / "pip"
-    print("Installing requirements...")
-    subprocess.run([str(pip_path), "install", "--upgrade", "pip"], check=True)
-    subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
-    
-    return venv_path
-
 
-def generate_icon():
-    """Generate a simple app icon (hand silhouette on blue gradient)."""
-    try:
-        from PIL import Image, ImageDraw
-    except ImportError:
-        print("Pillow not installed — skipping icon generation")
-        return None
-
-    size = 512
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # Blue gradient circle background
-    for i in range(size // 2, 0, -1):
-        ratio = i / (size // 2)
-        r = int(0 * ratio + 30 * (1 - ratio))
-        g = int(90 * ratio + 144 * (1 - ratio))
-        b = int(255 * ratio + 255 * (1 - ratio))
-        draw.ellipse(
-            [size // 2 - i, size // 2 - i, size // 2 + i, size // 2 + i],
-            fill=(r, g, b, 255)
-        )
-
-    # Simple hand shape (open palm)
-    palm_cx, palm_cy = size // 2, size // 2 + 40
-    palm_r = 80
-    draw.ellipse(
-        [palm_cx - palm_r, palm_cy - palm_r, palm_cx + palm_r, palm_cy + palm_r],
-        fill=(255, 255, 255, 230)
-    )
-
-    # Fingers
-    finger_positions = [
-        (palm_cx - 55, palm_cy - 60, 18, 90),   # pinky
-        (palm_cx - 22, palm_cy - 80, 18, 110),   # ring
-        (palm_cx + 10, palm_cy - 90, 18, 120),   # middle
-        (palm_cx + 42, palm_cy - 75, 18, 105),   # index
-        (palm_cx + 75, palm_cy - 20, 16, 70),    # thumb (angled)
-    ]
-
-    for fx, fy, fw, fh in finger_positions:
-        draw.rounded_rectangle(
-            [fx - fw, fy - fh, fx + fw, fy],
-            radius=fw,
-            fill=(255, 255, 255, 230)
-        )
-
-    # Save as PNG and convert to ICNS
-    icon_path = Path('build_resources')
-    icon_path.mkdir(exist_ok=True)
-
-    png_path = icon_path / 'icon.png'
-    img.save(str(png_path))
-
-    # Create iconset for macOS
-    iconset_path = icon_path / 'MinorityReport.iconset'
-    iconset_path.mkdir(exist_ok=True)
-
-    for sz in [16, 32, 64, 128, 256, 512]:
-        resized = img.resize((sz, sz), Image.LANCZOS)
-        resized.save(str(iconset_path / f'icon_{sz}x{sz}.png'))
-        if sz <= 256:
-            resized2x = img.resize((sz * 2, sz * 2), Image.LANCZOS)
-            resized2x.save(str(iconset_path / f'icon_{sz}x{sz}@2x.png'))
-
-    # Convert to icns
-    icns_path = icon_path / 'MinorityReport.icns'
-    try:
+    # Install requirements — prefer uv (parallel downloads, fast resolver)
+    # when it's on PATH, falling back to plain pip.
+    print("Installing requirements...")
+    uv_path = shutil.which("uv")
+    if uv_path:
         subprocess.run(
-            ['iconutil', '-c', 'icns', str(iconset_path), '-o', str(icns_path)],
-            check=True, capture_output=True
-        )
-        print(f"Icon generated: {icns_path}")
-        return str(icns_path)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("iconutil not available — using PNG icon")
-        return str(png_path)
+            [uv_path, "pip", "install",
+             "--python", str(venv_path / "bin" / "python"),
+             "-r", "requirements.txt"],
+            check=True)
+    else:
+        pip_path = venv_path / "bin" / "pip"
+        subprocess.run([str(pip_path), "install", "--upgrade", "pip"], check=True)
+        subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
+
+    stamp_path.write_text(req_mtime)
+    return venv_path
 
 
-def build_app(venv_path):
+def build_app(venv_path, clean: bool = False):
     """Build the app using PyInstaller."""
     print("Building Minority Report.app...")
 
     # Generate icon
-    icon_path = generate_icon()
+    icon_path, icon_proc = generate_icon()
 
     # Use Python from the venv
     python_path = venv_path / "bin" / "python"
@@ -157,7 +99,6 @@ def build_app(venv_path):
         '--windowed',
         '--onedir',
         '--noconfirm',
-        '--clean',
         '--add-data', 'config.py:.',
         '--hidden-import', 'mediapipe',
         '--hidden-import', 'cv2',
@@ -165,13 +106,24 @@ def build_app(venv_path):
         '--hidden-import', 'PIL',
     ]
 
+    # Incremental builds reuse PyInstaller's analysis cache; a full rebuild
+    # of the mediapipe/cv2 collection takes tens of seconds.
+    if clean:
+        cmd.append('--clean')
+
     if icon_path and icon_path.endswith('.icns'):
         cmd.extend(['--icon', icon_path])
 
     cmd.append('main.py')
 
     print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd)
+    result = subprocess.Popen(cmd)
+
+    # iconutil finishes well within PyInstaller's analysis stage; the icns
+    # only needs to exist by the time the .app bundle is assembled.
+    finalize_icon(icon_proc, icon_path)
+
+    result.wait()
 
     if result.returncode == 0:
         print("\n✅ Build successful!")
@@ -187,6 +139,12 @@ def build_app(venv_path):
 
 
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Build Minority Report.app (Python 3.11)')
+    parser.add_argument('--clean', action='store_true',
+                        help='Force a full PyInstaller rebuild (slow)')
+    args = parser.parse_args()
+
     print("HandControl macOS App Builder (Python 3.11)")
     print("=" * 50)
 
@@ -200,7 +158,7 @@ def main():
         venv_path = setup_venv(python311_path)
 
         # Build the app
-        success = build_app(venv_path)
+        success = build_app(venv_path, clean=args.clean)
 
         if success:
             print("\n🎉 Build complete!")
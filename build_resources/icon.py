@@ -0,0 +1,133 @@
+"""
+Shared app-icon generation for the build scripts.
+
+Previously copy-pasted into build_app.py and build_app_py311.py; both now
+import generate_icon() from here.
+"""
+import subprocess
+import hashlib
+from pathlib import Path
+
+
+def generate_icon():
+    """Generate a simple app icon (hand silhouette on blue gradient).
+
+    Returns (icon_path, icon_proc). When a fresh .icns is being produced,
+    icon_proc is the running iconutil process so callers can overlap it
+    with other work; otherwise it is None.
+    """
+    try:
+        from PIL import Image, ImageDraw
+        import numpy as np
+    except ImportError:
+        print("Pillow not installed — skipping icon generation")
+        return None, None
+
+    size = 512
+    radius = size // 2
+
+    # Blue gradient circle background — one vectorized radial gradient
+    # instead of 256 concentric draw.ellipse calls.
+    yy, xx = np.mgrid[0:size, 0:size]
+    dist = np.sqrt((xx - radius) ** 2 + (yy - radius) ** 2)
+    ratio = np.clip(dist / radius, 0.0, 1.0)
+    gradient = np.zeros((size, size, 4), dtype=np.uint8)
+    gradient[..., 0] = (30 * (1 - ratio)).astype(np.uint8)
+    gradient[..., 1] = (90 * ratio + 144 * (1 - ratio)).astype(np.uint8)
+    gradient[..., 2] = 255
+    gradient[..., 3] = np.where(dist <= radius, 255, 0).astype(np.uint8)
+
+    img = Image.fromarray(gradient, 'RGBA')
+    draw = ImageDraw.Draw(img)
+
+    # Simple hand shape (open palm)
+    palm_cx, palm_cy = size // 2, size // 2 + 40
+    palm_r = 80
+    draw.ellipse(
+        [palm_cx - palm_r, palm_cy - palm_r, palm_cx + palm_r, palm_cy + palm_r],
+        fill=(255, 255, 255, 230)
+    )
+
+    # Fingers
+    finger_positions = [
+        (palm_cx - 55, palm_cy - 60, 18, 90),   # pinky
+        (palm_cx - 22, palm_cy - 80, 18, 110),   # ring
+        (palm_cx + 10, palm_cy - 90, 18, 120),   # middle
+        (palm_cx + 42, palm_cy - 75, 18, 105),   # index
+        (palm_cx + 75, palm_cy - 20, 16, 70),    # thumb (angled)
+    ]
+
+    for fx, fy, fw, fh in finger_positions:
+        draw.rounded_rectangle(
+            [fx - fw, fy - fh, fx + fw, fy],
+            radius=fw,
+            fill=(255, 255, 255, 230)
+        )
+
+    # Save as PNG and convert to ICNS
+    icon_path = Path('build_resources')
+    icon_path.mkdir(exist_ok=True)
+
+    png_path = icon_path / 'icon.png'
+    img.save(str(png_path))
+
+    # Skip the iconset + iconutil work when the rendered icon is unchanged.
+    icns_path = icon_path / 'MinorityReport.icns'
+    hash_path = icon_path / 'MinorityReport.icns.hash'
+    png_hash = hashlib.sha256(png_path.read_bytes()).hexdigest()
+    if icns_path.exists() and hash_path.exists() and hash_path.read_text() == png_hash:
+        print(f"Icon up to date: {icns_path}")
+        return str(icns_path), None
+
+    # Create iconset for macOS
+    iconset_path = icon_path / 'MinorityReport.iconset'
+    iconset_path.mkdir(exist_ok=True)
+
+    # Chain-downsample 512 -> 256 -> ... -> 16 so each LANCZOS pass reads the
+    # previous (4x smaller) result instead of re-convolving the full 512x512.
+    scaled = {512: img}
+    current = img
+    for sz in [256, 128, 64, 32, 16]:
+        current = current.resize((sz, sz), Image.LANCZOS)
+        scaled[sz] = current
+
+    for sz in [16, 32, 64, 128, 256, 512]:
+        scaled[sz].save(str(iconset_path / f'icon_{sz}x{sz}.png'))
+        if sz <= 256:
+            scaled[sz * 2].save(str(iconset_path / f'icon_{sz}x{sz}@2x.png'))
+
+    # Convert to icns. iconutil runs asynchronously so the caller can
+    # overlap its ~1-2s with PyInstaller's much longer analysis stage.
+    # The hash sidecar is only written once iconutil succeeds (see
+    # finalize_icon); drop any stale one now so a failed or interrupted
+    # run next to an old .icns can never look like a cache hit.
+    hash_path.unlink(missing_ok=True)
+    try:
+        proc = subprocess.Popen(
+            ['iconutil', '-c', 'icns', str(iconset_path), '-o', str(icns_path)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return str(icns_path), proc
+    except FileNotFoundError:
+        print("iconutil not available — using PNG icon")
+        return str(png_path), None
+
+
+def finalize_icon(icon_proc, icon_path):
+    """Wait for a pending iconutil run and record the cache hash.
+
+    No-op when generate_icon returned no process (cache hit, PNG
+    fallback, or no Pillow). On a clean exit the content hash of the
+    rendered PNG is written next to the .icns so the next build can skip
+    the conversion; on failure nothing is written, keeping the cache
+    check in generate_icon honest.
+    """
+    if icon_proc is None:
+        return
+    if icon_proc.wait() != 0:
+        print("Warning: iconutil failed — the app may be missing its icon")
+        return
+    icon_dir = Path('build_resources')
+    png_hash = hashlib.sha256((icon_dir / 'icon.png').read_bytes()).hexdigest()
+    (icon_dir / 'MinorityReport.icns.hash').write_text(png_hash)
+    print(f"Icon generated: {icon_path}")
@@ -4,10 +4,15 @@ Calibration system with perspective transform for HandControl.
 """
 import time
 import json
+import logging
 import os
 import math
 from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
+# numpy stays a module-level import: CalibrationPoint allocates its sample
+# buffers at construction, and whenever cv2 is present numpy has been
+# imported anyway. The genuinely heavy imports (camera, hand_tracker,
+# pyautogui) are local to run_calibration_tool.
 import numpy as np
 
 try:
@@ -16,6 +21,37 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _apply_homography(m, xs, ys, oxs, oys):  # pragma: no cover - compiled
+        for i in range(xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            w = m[6] * x + m[7] * y + m[8]
+            oxs[i] = (m[0] * x + m[1] * y + m[2]) / w
+            oys[i] = (m[3] * x + m[4] * y + m[5]) / w
+
+
+# Diagnostics go through logging (debug level by default) rather than
+# print() — stdout writes contend for the io lock inside the capture loop.
+log = logging.getLogger(__name__)
+
+# Precomputed pulse offsets for the calibration target animation
+# (replaces a per-frame math.sin call; ~1.6s period at the LUT step used)
+_PULSE_LUT = [int(5 * math.sin(i * 2 * math.pi / 64)) for i in range(64)]
+
 
 class CalibrationState(Enum):
     WAITING = "waiting"
@@ -26,6 +62,9 @@ class CalibrationState(Enum):
 
 
 class CalibrationPoint:
+    __slots__ = ('screen_x', 'screen_y', 'name', 'camera_x', 'camera_y',
+                 'is_captured', '_sx', '_sy', '_n')
+
     def __init__(self, screen_x: float, screen_y: float, name: str):
         self.screen_x = screen_x
         self.screen_y = screen_y
@@ -33,7 +72,16 @@ class CalibrationPoint:
         self.camera_x: Optional[float] = None
         self.camera_y: Optional[float] = None
         self.is_captured = False
-        self.samples: List[Tuple[float, float]] = []
+        # Struct-of-arrays sample buffer: appending is an index write and
+        # finalizing is one vectorized mean, with no per-sample tuple boxing.
+        self._sx = np.empty(128, dtype=np.float32)
+        self._sy = np.empty(128, dtype=np.float32)
+        self._n = 0
+
+    @property
+    def samples(self) -> List[Tuple[float, float]]:
+        """Materialized view of collected samples (for inspection/tests)."""
+        return list(zip(self._sx[:self._n].tolist(), self._sy[:self._n].tolist()))
 
     def capture(self, camera_x: float, camera_y: float) -> None:
         self.camera_x = camera_x
@@ -41,12 +89,20 @@ class CalibrationPoint:
         self.is_captured = True
 
     def add_sample(self, x: float, y: float) -> None:
-        self.samples.append((x, y))
+        if self._n == self._sx.shape[0]:
+            self._sx = np.resize(self._sx, self._n * 2)
+            self._sy = np.resize(self._sy, self._n * 2)
+        self._sx[self._n] = x
+        self._sy[self._n] = y
+        self._n += 1
+
+    def clear_samples(self) -> None:
+        self._n = 0
 
     def finalize_from_samples(self) -> None:
-        if self.samples:
-            avg_x = sum(s[0] for s in self.samples) / len(self.samples)
-            avg_y = sum(s[1] for s in self.samples) / len(self.samples)
+        if self._n:
+            avg_x = float(self._sx[:self._n].mean())
+            avg_y = float(self._sy[:self._n].mean())
             self.capture(avg_x, avg_y)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -68,10 +124,18 @@ class CalibrationPoint:
 class ScreenCalibrator:
     """5-point calibration with perspective transform."""
 
-    def __init__(self, screen_width: int = 1920, screen_height: int = 1080):
+    def __init__(self, screen_width: int = 1920, screen_height: int = 1080,
+                 use_opencl: bool = False):
         self.screen_width = screen_width
         self.screen_height = screen_height
 
+        # Optional OpenCL (Transparent API) offload for UI raster ops.
+        # Off by default: at 640x480 the UMat upload/download roundtrip can
+        # cost more than the CPU drawing it saves.
+        self._use_umat = use_opencl and CV2_AVAILABLE and cv2.ocl.haveOpenCL()
+        if self._use_umat:
+            cv2.ocl.setUseOpenCL(True)
+
         # 4 corners for perspective transform + center for validation
         self.points = [
             CalibrationPoint(0.1, 0.1, "Top Left"),
@@ -85,12 +149,28 @@ class ScreenCalibrator:
         self.state = CalibrationState.WAITING
         self.show_instructions = True
 
-        # Perspective transform matrix
+        # Perspective transform matrix (and its coefficients flattened to
+        # plain floats so map_point stays pure-Python on the hot path)
         self._transform_matrix: Optional[np.ndarray] = None
+        self._m: Optional[List[float]] = None
+        self._m_arr: Optional[np.ndarray] = None
+        self._mi: Optional[List[float]] = None
+
+        # Scratch buffers for _compute_transform
+        self._src_buf = np.empty((4, 2), dtype=np.float32)
+        self._dst_buf = np.empty((4, 2), dtype=np.float32)
 
         # Hand size at calibration time (for auto-recalibration)
         self.calibration_hand_size: Optional[float] = None
 
+        # Per-frame UI draw caches
+        self._label_cache: Dict[Tuple[str, int], Tuple[str, Tuple[int, int]]] = {}
+        self._bar_cache: Tuple[int, int, int] = (0, 0, 0)
+        self._bar_cache_key: Optional[Tuple[int, int]] = None
+        self._instructions_overlay: Optional[np.ndarray] = None
+        self._px_cache: Optional[Tuple[int, int, List[Tuple[int, int]]]] = None
+        self._sprite_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
     def start_calibration(self) -> None:
         self.current_point_index = 0
         self.state = CalibrationState.SHOWING_TARGET
@@ -99,9 +179,12 @@ class ScreenCalibrator:
             point.is_captured = False
             point.camera_x = None
             point.camera_y = None
-            point.samples.clear()
+            point.clear_samples()
 
         self._transform_matrix = None
+        self._m = None
+        self._m_arr = None
+        self._mi = None
 
     def get_current_target(self) -> Optional[CalibrationPoint]:
         if 0 <= self.current_point_index < len(self.points):
@@ -109,49 +192,105 @@ class ScreenCalibrator:
         return None
 
     def capture_point(self, finger_x: float, finger_y: float) -> bool:
-        current = self.get_current_target()
-        if not current:
+        # Inlined target lookup/capture — this sits in the calibration
+        # tool's inner loop.
+        i = self.current_point_index
+        points = self.points
+        if i >= len(points) or i < 0:
             return False
 
-        current.capture(finger_x, finger_y)
-        self.current_point_index += 1
+        point = points[i]
+        point.camera_x = finger_x
+        point.camera_y = finger_y
+        point.is_captured = True
 
-        if self.current_point_index >= len(self.points):
+        i += 1
+        self.current_point_index = i
+        if i >= len(points):
             self.state = CalibrationState.COMPLETE
             self._compute_transform()
-            return True
-
-        self.state = CalibrationState.SHOWING_TARGET
+        else:
+            self.state = CalibrationState.SHOWING_TARGET
         return True
 
+    def finalize_all_samples(self) -> None:
+        """Finalize every point that collected samples.
+
+        Each point's finalize is a single vectorized mean over its SoA
+        buffer, so this is five SIMD reductions with no per-sample Python
+        work.
+        """
+        for point in self.points:
+            point.finalize_from_samples()
+
     def _compute_transform(self) -> None:
         """Compute perspective transform from the 4 corner points."""
         if not CV2_AVAILABLE:
             return
 
-        # Source points (camera space)
-        src = np.float32([
-            [self.points[i].camera_x, self.points[i].camera_y]
-            for i in range(4)
-        ])
-
-        # Destination points (screen normalized space)
-        dst = np.float32([
-            [self.points[i].screen_x, self.points[i].screen_y]
-            for i in range(4)
-        ])
-
-        self._transform_matrix = cv2.getPerspectiveTransform(src, dst)
+        # Fill the preallocated buffers in place — auto-recalibration can
+        # rerun this often, and filling avoids list->array conversions.
+        for i in range(4):
+            point = self.points[i]
+            self._src_buf[i, 0] = point.camera_x
+            self._src_buf[i, 1] = point.camera_y
+            self._dst_buf[i, 0] = point.screen_x
+            self._dst_buf[i, 1] = point.screen_y
+
+        self._transform_matrix = cv2.getPerspectiveTransform(self._src_buf, self._dst_buf)
+        self._m = self._transform_matrix.ravel().tolist()
+        self._m_arr = self._transform_matrix.ravel().astype(np.float64)
+        # Inverse computed once here so debug overlays can map screen
+        # coords back to camera space without a runtime np.linalg.inv.
+        self._mi = np.linalg.inv(self._transform_matrix).ravel().tolist()
 
     def map_point(self, camera_x: float, camera_y: float) -> Tuple[float, float]:
         """Map camera coordinates to screen coordinates using perspective transform."""
-        if self._transform_matrix is not None:
-            pt = np.float32([[[camera_x, camera_y]]])
-            mapped = cv2.perspectiveTransform(pt, self._transform_matrix)
-            return float(mapped[0][0][0]), float(mapped[0][0][1])
+        if self._m is not None:
+            # Inlined 3x3 homography on plain floats — no per-call numpy
+            # allocation or cv2 dispatch on the cursor-update path.
+            m = self._m
+            w = m[6] * camera_x + m[7] * camera_y + m[8]
+            return (
+                (m[0] * camera_x + m[1] * camera_y + m[2]) / w,
+                (m[3] * camera_x + m[4] * camera_y + m[5]) / w,
+            )
         # Fallback: identity
         return camera_x, camera_y
 
+    def map_point_inverse(self, screen_x: float, screen_y: float) -> Tuple[float, float]:
+        """Map screen coordinates back to camera coordinates."""
+        if self._mi is not None:
+            m = self._mi
+            w = m[6] * screen_x + m[7] * screen_y + m[8]
+            return (
+                (m[0] * screen_x + m[1] * screen_y + m[2]) / w,
+                (m[3] * screen_x + m[4] * screen_y + m[5]) / w,
+            )
+        return screen_x, screen_y
+
+    def map_points(self, pts_xy: np.ndarray) -> np.ndarray:
+        """Map an (N, 2) array of camera coordinates to screen coordinates.
+
+        One batched perspectiveTransform call replaces N single-point calls,
+        amortizing the allocation and FFI overhead across the whole set
+        (e.g. all 21 landmarks of a frame, or a finger trajectory).
+        """
+        if self._transform_matrix is None:
+            return pts_xy
+        if NUMBA_AVAILABLE:
+            pts = np.ascontiguousarray(pts_xy, dtype=np.float64).reshape(-1, 2)
+            out = np.empty_like(pts)
+            _apply_homography(self._m_arr, pts[:, 0].copy(), pts[:, 1].copy(),
+                              out[:, 0], out[:, 1])
+            return out
+        # Direct homogeneous matmul — same math as cv2.perspectiveTransform
+        # without the FFI roundtrip (and without needing cv2 at all).
+        pts = np.asarray(pts_xy, dtype=np.float64).reshape(-1, 2)
+        hom = np.concatenate([pts, np.ones((pts.shape[0], 1), dtype=pts.dtype)], axis=1)
+        out = hom @ self._transform_matrix.T
+        return out[:, :2] / out[:, 2:3]
+
     def should_recalibrate(self, current_hand_size: float, tolerance: float = 0.3) -> bool:
         """Check if hand size changed enough to warrant recalibration."""
         if self.calibration_hand_size is None:
@@ -188,17 +327,29 @@ class ScreenCalibrator:
         try:
             filepath = os.path.expanduser(filepath)
             os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            # orjson serializes several times faster; same on-disk format.
+            # Pretty-printing is only for humans — skip it unless debugging.
+            pretty = bool(os.environ.get('HANDCONTROL_DEBUG'))
+            with open(filepath, 'wb') as f:
+                if ORJSON_AVAILABLE:
+                    opts = orjson.OPT_INDENT_2 if pretty else 0
+                    f.write(orjson.dumps(data, option=opts))
+                elif pretty:
+                    f.write(json.dumps(data, indent=2).encode('utf-8'))
+                else:
+                    f.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+            log.debug("Saved calibration to %s", filepath)
             return True
-        except Exception:
+        except Exception as e:
+            log.debug("Could not save calibration to %s: %s", filepath, e)
             return False
 
     def load_calibration(self, filepath: str) -> bool:
         try:
             filepath = os.path.expanduser(filepath)
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
             if 'points' not in data:
                 return False
@@ -218,8 +369,10 @@ class ScreenCalibrator:
             self.calibration_hand_size = data.get('hand_size')
             self.state = CalibrationState.COMPLETE
             self._compute_transform()
+            log.debug("Loaded calibration from %s", filepath)
             return True
-        except Exception:
+        except Exception as e:
+            log.debug("Could not load calibration from %s: %s", filepath, e)
             return False
 
     def draw_calibration_ui(self, frame) -> None:
@@ -227,41 +380,185 @@ class ScreenCalibrator:
             return
 
         h, w = frame.shape[:2]
+
+        if self._use_umat and not isinstance(frame, cv2.UMat):
+            # Draw on the GPU via the Transparent API, then copy back into
+            # the caller's ndarray.
+            target = cv2.UMat(frame)
+            self._draw_ui(target, w, h)
+            np.copyto(frame, target.get())
+        else:
+            self._draw_ui(frame, w, h)
+
+    def _get_target_sprite(self, pulse: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Pre-rendered calibration target for one discrete pulse amplitude."""
+        cached = self._sprite_cache.get(pulse)
+        if cached is None:
+            s = 120
+            c = s // 2
+            sprite = np.zeros((s, s, 3), dtype=np.uint8)
+            cv2.circle(sprite, (c, c), 50 + pulse, (255, 255, 255), 2)
+            cv2.circle(sprite, (c, c), 8, (0, 122, 255), -1)
+            cv2.line(sprite, (c - 20, c), (c + 20, c), (255, 255, 255), 1)
+            cv2.line(sprite, (c, c - 20), (c, c + 20), (255, 255, 255), 1)
+            mask = sprite.any(axis=2)[..., None]
+            cached = (sprite, mask)
+            self._sprite_cache[pulse] = cached
+        return cached
+
+    def _draw_ui(self, frame, w: int, h: int) -> None:
+        # Instruction lines are static text — rasterize the glyphs once into
+        # an overlay and blit it, instead of several putText calls per frame.
+        if self.show_instructions and isinstance(frame, np.ndarray):
+            overlay = self._instructions_overlay
+            if overlay is None:
+                overlay = np.zeros((70, 360, 3), dtype=np.uint8)
+                lines = (
+                    "Point your index finger at each target",
+                    "Hold steady to capture",
+                    "Press Q or Esc to cancel",
+                )
+                for i, text in enumerate(lines):
+                    cv2.putText(overlay, text, (8, 18 + i * 22),
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 255, 255), 1)
+                self._instructions_overlay = overlay
+            oh, ow = overlay.shape[:2]
+            if h > oh + 8 and w > ow + 8:
+                region = frame[8:8 + oh, 8:8 + ow]
+                cv2.add(region, overlay, dst=region)
+
         current = self.get_current_target()
 
         if current and self.state == CalibrationState.SHOWING_TARGET:
-            tx = int(current.screen_x * w)
-            ty = int(current.screen_y * h)
-
-            # Animated circle
-            t = time.time()
-            pulse = int(5 * math.sin(t * 4))
-
-            # Outer ring
-            cv2.circle(frame, (tx, ty), 50 + pulse, (255, 255, 255), 2)
-            # Inner dot
-            cv2.circle(frame, (tx, ty), 8, (0, 122, 255), -1)
-            # Crosshair
-            cv2.line(frame, (tx - 20, ty), (tx + 20, ty), (255, 255, 255), 1)
-            cv2.line(frame, (tx, ty - 20), (tx, ty + 20), (255, 255, 255), 1)
-
-            label = f"{current.name} ({self.current_point_index + 1}/{len(self.points)})"
-            cv2.putText(frame, label, (tx - 60, ty - 65),
+            # Target pixel positions only change with the frame size
+            if self._px_cache is None or self._px_cache[0] != w or self._px_cache[1] != h:
+                self._px_cache = (w, h, [
+                    (int(p.screen_x * w), int(p.screen_y * h)) for p in self.points
+                ])
+            tx, ty = self._px_cache[2][self.current_point_index]
+
+            # Animated circle — LUT lookup instead of per-frame math.sin
+            pulse = _PULSE_LUT[int(time.time() * 40) & 63]
+
+            # The whole target (ring, dot, crosshair) blits as one cached
+            # sprite — a single masked copy instead of four cv2 draw calls.
+            sprite, mask = self._get_target_sprite(pulse)
+            sh, sw = sprite.shape[:2]
+            y0, x0 = ty - sh // 2, tx - sw // 2
+            if (isinstance(frame, np.ndarray)
+                    and y0 >= 0 and x0 >= 0 and y0 + sh <= h and x0 + sw <= w):
+                np.copyto(frame[y0:y0 + sh, x0:x0 + sw], sprite, where=mask)
+            else:
+                # Near the frame edge (or on UMat) fall back to primitives
+                cv2.circle(frame, (tx, ty), 50 + pulse, (255, 255, 255), 2)
+                cv2.circle(frame, (tx, ty), 8, (0, 122, 255), -1)
+                cv2.line(frame, (tx - 20, ty), (tx + 20, ty), (255, 255, 255), 1)
+                cv2.line(frame, (tx, ty - 20), (tx, ty + 20), (255, 255, 255), 1)
+
+            # Label string and its rendered size only change per target —
+            # cache both (getTextSize is an FFI call per lookup otherwise).
+            label_key = (current.name, self.current_point_index)
+            cached_label = self._label_cache.get(label_key)
+            if cached_label is None:
+                label = f"{current.name} ({self.current_point_index + 1}/{len(self.points)})"
+                size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+                cached_label = (label, size)
+                self._label_cache[label_key] = cached_label
+            label, label_size = cached_label
+            cv2.putText(frame, label, (tx - label_size[0] // 2, ty - 65),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
 
-        # Progress
+        # Progress bar geometry only depends on the frame size
         progress = self.get_progress()
-        bar_w = int(w * 0.4)
-        bar_x = (w - bar_w) // 2
-        bar_y = h - 40
+        if self._bar_cache_key != (w, h):
+            bar_w = int(w * 0.4)
+            self._bar_cache = (bar_w, (w - bar_w) // 2, h - 40)
+            self._bar_cache_key = (w, h)
+        bar_w, bar_x, bar_y = self._bar_cache
         cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_w, bar_y + 12), (60, 60, 60), -1)
         if progress > 0:
             cv2.rectangle(frame, (bar_x, bar_y),
                           (bar_x + int(bar_w * progress), bar_y + 12), (0, 122, 255), -1)
 
 
-def run_calibration_tool(camera_index: int = 0) -> bool:
+def run_calibration_tool(camera_index: int = 0,
+                         save_path: str = '~/.minority_report/calibration.json') -> bool:
+    """Interactive 5-point calibration loop.
+
+    Captures at 640x480 (the Camera class also requests BUFFERSIZE=1) so
+    MediaPipe preprocessing stays cheap — the hand tracker dominates the
+    loop and its cost scales with pixel count.
+
+    Capture runs on the Camera's background thread (single producer,
+    latest-frame buffer), so USB/UVC transfer overlaps hand-tracker
+    inference instead of serializing with it.
+    """
     if not CV2_AVAILABLE:
         return False
-    # Placeholder — real calibration happens in UI module
-    return False
+
+    # Heavy imports stay local so importing this module is cheap
+    from camera import Camera
+    from hand_tracker import HandTracker
+    import pyautogui
+
+    camera = Camera(camera_index=camera_index, width=640, height=480,
+                    fps_target=30, mirror=True)
+    if not camera.open():
+        log.warning("Could not open camera for calibration")
+        return False
+
+    tracker = HandTracker(max_num_hands=1)
+    calibrator = ScreenCalibrator(*pyautogui.size())
+    calibrator.start_calibration()
+
+    hold_frames = 30  # ~1s of steady pointing per target
+    held = 0
+    frame_no = 0
+
+    # Tracker consumes frames at full camera rate; the overlay is only
+    # repainted at display rate.
+    ui_interval = 1.0 / 60.0
+    last_ui_draw = 0.0
+
+    try:
+        while not calibrator.is_complete():
+            # Blocking on the frame counter paces the loop to camera
+            # cadence, so `held` counts distinct captures — a fast loop
+            # can't satisfy the hold by resampling one frame.
+            frame_no, frame = camera.read_blocking(frame_no, timeout=0.5)
+            if frame is None:
+                continue
+
+            result = tracker.process_frame(frame)
+            hand = result.dominant
+            target = calibrator.get_current_target()
+
+            if hand is not None and target is not None:
+                tip = hand[8]  # index fingertip
+                target.add_sample(tip.x, tip.y)
+                held += 1
+                if held >= hold_frames:
+                    target.finalize_from_samples()
+                    calibrator.capture_point(target.camera_x, target.camera_y)
+                    held = 0
+            else:
+                held = 0
+                if target is not None:
+                    target.clear_samples()
+
+            now = time.monotonic()
+            if now - last_ui_draw >= ui_interval:
+                calibrator.draw_calibration_ui(frame)
+                cv2.imshow('Calibration', frame)
+                last_ui_draw = now
+            key = cv2.waitKey(1) & 0xFF
+            if key in (ord('q'), 27):  # q or Esc
+                calibrator.cancel()
+                return False
+    finally:
+        camera.close()
+        tracker.close()
+        cv2.destroyAllWindows()
+
+    calibrator.save_calibration(save_path)
+    return True
@@ -3,10 +3,12 @@ Threaded camera capture for HandControl
 Captures frames on a background thread so processing never blocks capture.
 Always provides the latest frame (skips old ones).
 """
+import logging
+import sys
 import time
 import threading
+import weakref
 from typing import Optional, Tuple
-from collections import deque
 import numpy as np
 
 try:
@@ -15,6 +17,8 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+log = logging.getLogger(__name__)
+
 
 class Camera:
     """
@@ -29,7 +33,10 @@ class Camera:
                  fps_target: int = 30,
                  mirror: bool = True,
                  use_threading: bool = True,
-                 fps_window_size: int = 30):
+                 fps_window_size: int = 30,
+                 backend: Optional[str] = None,
+                 color: str = 'BGR',
+                 track_fps: bool = True):
         if not CV2_AVAILABLE:
             raise ImportError("OpenCV is not available")
 
@@ -40,24 +47,57 @@ class Camera:
         self.mirror = mirror
         self.use_threading = use_threading
         self.fps_window_size = fps_window_size
+        self.backend = backend
+        # 'RGB' fuses the channel swap into the publish copy, saving the
+        # full-frame cv2.cvtColor that MediaPipe consumers otherwise run.
+        self.color = color.upper()
 
-        # FPS tracking
-        self.frame_times: deque = deque(maxlen=fps_window_size)
-        self.last_frame_time = time.time()
+        # FPS tracking — ring buffer of inter-frame deltas (monotonic ns)
+        # with a running sum, so recording is O(1) and so is get_fps().
+        # track_fps=False skips the per-frame clock read entirely.
+        self._track_fps = track_fps
+        self._times = np.zeros(fps_window_size, dtype=np.int64)
+        self._time_idx = 0
+        self._time_count = 0
+        self._sum_ns = 0
+        self._last_ns = time.monotonic_ns()
 
-        # Threading state
-        self._lock = threading.Lock()
-        self._latest_frame: Optional[np.ndarray] = None
-        self._frame_ready = threading.Event()
+        # Threading state — double buffer: the capture thread decodes into a
+        # scratch buffer, mirrors into the back slot and publishes the slot
+        # index, so read() never has to copy.
+        self._cond = threading.Condition()
+        self._decode_buf: Optional[np.ndarray] = None
+        self._bufs: Optional[list] = None
+        self._published = -1
+        self._fresh = False
+        self._frame_number = 0
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_opened = False
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def _capture_api(self) -> int:
+        """Resolve the OpenCV capture backend for this platform/config."""
+        backends = {
+            'avfoundation': getattr(cv2, 'CAP_AVFOUNDATION', cv2.CAP_ANY),
+            'v4l2': getattr(cv2, 'CAP_V4L2', cv2.CAP_ANY),
+            'any': cv2.CAP_ANY,
+        }
+        if self.backend:
+            return backends.get(self.backend.lower(), cv2.CAP_ANY)
+        if sys.platform == 'darwin':
+            return backends['avfoundation']
+        if sys.platform.startswith('linux'):
+            return backends['v4l2']
+        return cv2.CAP_ANY
 
     def open(self) -> bool:
         try:
-            self.cap = cv2.VideoCapture(self.camera_index)
+            # An explicit backend skips OpenCV's probe of every compiled-in
+            # API and enables backend-specific fast paths.
+            self.cap = cv2.VideoCapture(self.camera_index, self._capture_api())
             if not self.cap.isOpened():
                 return False
 
@@ -66,13 +106,28 @@ class Camera:
             self.cap.set(cv2.CAP_PROP_FPS, self.fps_target)
             # Minimize buffer to reduce latency
             self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            # MJPG cuts USB bandwidth ~10x vs raw YUYV and moves the
+            # per-frame conversion into libjpeg-turbo's SIMD decoder.
+            # Cameras that don't support it simply ignore the request.
+            self.cap.set(cv2.CAP_PROP_FOURCC,
+                         cv2.VideoWriter_fourcc(*'MJPG'))
 
             ret, frame = self.cap.read()
             if not ret:
                 self.cap.release()
                 return False
 
+            # Size the double-buffer slots from the first decoded frame
+            self._decode_buf = np.empty_like(frame)
+            self._bufs = [np.empty_like(frame), np.empty_like(frame)]
+            self._published = -1
+
             self.is_opened = True
+            # GC fallback that only releases the capture handle — joining
+            # the capture thread from a finalizer can deadlock during
+            # interpreter shutdown, so explicit close() remains the way to
+            # stop the thread cleanly.
+            self._finalizer = weakref.finalize(self, _release_capture, self.cap)
 
             if self.use_threading:
                 self._running = True
@@ -81,59 +136,132 @@ class Camera:
 
             return True
         except Exception as e:
-            print(f"Error opening camera: {e}")
+            # %s-style args defer formatting until the record is actually
+            # emitted — no string work on the capture path when errors are
+            # filtered out.
+            log.error("Error opening camera: %s", e)
             if self.cap:
                 self.cap.release()
             return False
 
     def _capture_loop(self) -> None:
-        """Background thread: continuously grab the latest frame."""
+        """Background thread: continuously grab the latest frame.
+
+        GIL note: cap.grab()/retrieve() and np.copyto release the GIL for
+        the duration of the transfer/decode/copy, so virtually all of this
+        loop's wall time runs concurrently with MediaPipe inference on the
+        main thread; only the thin Python glue between calls holds the GIL.
+        """
         while self._running and self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
+            # grab() is just the USB transfer — no YUV/JPEG decode. Only
+            # retrieve (decode) when the consumer has taken the previous
+            # frame, so a slow consumer never pays for wasted conversions.
+            if not self.cap.grab():
+                continue
+            if self._fresh:
+                continue
+            ret, frame = self.cap.retrieve(self._decode_buf)
             if not ret:
                 continue
-            if self.mirror:
-                frame = cv2.flip(frame, 1)
-            with self._lock:
-                self._latest_frame = frame
-            self._frame_ready.set()
+            back = 1 - self._published if self._published >= 0 else 0
+            # Mirror and/or channel swap are stride tricks on the source
+            # view; the copyto below materializes everything in one pass.
+            src = frame[:, ::-1] if self.mirror else frame
+            if self.color == 'RGB':
+                src = src[:, :, ::-1]
+            np.copyto(self._bufs[back], src)
+            with self._cond:
+                self._published = back
+                self._fresh = True
+                self._frame_number += 1
+                self._cond.notify_all()
 
     def read(self) -> Tuple[bool, Optional[np.ndarray]]:
         if not self.is_opened or not self.cap:
             return False, None
 
         if self.use_threading:
-            with self._lock:
-                frame = self._latest_frame
-            if frame is None:
-                return False, None
-            # Update FPS tracking
-            now = time.time()
-            self.frame_times.append(now - self.last_frame_time)
-            self.last_frame_time = now
-            return True, frame.copy()
-        else:
-            ret, frame = self.cap.read()
-            if not ret:
+            return self._read_threaded()
+        return self._read_sync()
+
+    def _read_threaded(self) -> Tuple[bool, Optional[np.ndarray]]:
+        with self._cond:
+            # Serve each captured frame at most once. Re-serving the
+            # published buffer would hand consumers a frame they may
+            # already have drawn overlays into — which the tracker would
+            # then reprocess as camera input.
+            if not self._fresh:
                 return False, None
-            if self.mirror:
-                frame = cv2.flip(frame, 1)
-            now = time.time()
-            self.frame_times.append(now - self.last_frame_time)
-            self.last_frame_time = now
-            return True, frame
+            idx = self._published
+            self._fresh = False
+        self._record_frame_time()
+        # Zero-copy: the returned frame is owned by the Camera. It is
+        # safe to draw into until the next capture overwrites it, but it
+        # is never handed out again — callers that need a frame beyond
+        # their current iteration must copy it themselves.
+        return True, self._bufs[idx]
+
+    def _read_sync(self) -> Tuple[bool, Optional[np.ndarray]]:
+        ret, frame = self.cap.read()
+        if not ret:
+            return False, None
+        src = frame[:, ::-1] if self.mirror else frame
+        if self.color == 'RGB':
+            src = src[:, :, ::-1]
+        if src is not frame:
+            # Contiguity matters downstream (MediaPipe), so materialize
+            # the strided view in one pass.
+            frame = np.ascontiguousarray(src)
+        self._record_frame_time()
+        return True, frame
+
+    def read_blocking(self, last_seen: int = 0,
+                      timeout: Optional[float] = None
+                      ) -> Tuple[int, Optional[np.ndarray]]:
+        """Block until a frame newer than ``last_seen`` is published.
+
+        Returns (frame_number, frame); pass the frame number back in to
+        pace a consumer exactly to camera cadence without polling. On
+        timeout (or in non-threaded mode) returns (last_seen, None). The
+        same zero-copy ownership rules as read() apply.
+        """
+        if not self.use_threading or not self.is_opened:
+            return last_seen, None
+        with self._cond:
+            if not self._cond.wait_for(
+                    lambda: self._frame_number > last_seen, timeout=timeout):
+                return last_seen, None
+            self._fresh = False
+            number = self._frame_number
+            frame = self._bufs[self._published]
+        self._record_frame_time()
+        return number, frame
+
+    def _record_frame_time(self) -> None:
+        if not self._track_fps:
+            return
+        now = time.monotonic_ns()
+        dt = now - self._last_ns
+        self._last_ns = now
+        self._sum_ns += dt - int(self._times[self._time_idx])
+        self._times[self._time_idx] = dt
+        self._time_idx = (self._time_idx + 1) % self._times.shape[0]
+        if self._time_count < self._times.shape[0]:
+            self._time_count += 1
 
     def get_fps(self) -> float:
-        if len(self.frame_times) == 0:
+        if self._sum_ns <= 0 or self._time_count == 0:
             return 0.0
-        avg = sum(self.frame_times) / len(self.frame_times)
-        return 1.0 / avg if avg > 0 else 0.0
+        return self._time_count * 1e9 / self._sum_ns
 
     def close(self) -> None:
         self._running = False
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        if self._finalizer:
+            self._finalizer.detach()
+            self._finalizer = None
         if self.cap:
             self.cap.release()
             self.is_opened = False
@@ -146,6 +274,7 @@ class Camera:
     def __exit__(self, *args):
         self.close()
 
-    def __del__(self):
-        if hasattr(self, 'cap'):
-            self.close()
+
+def _release_capture(cap) -> None:
+    """weakref.finalize callback — module-level so it holds no Camera ref."""
+    cap.release()
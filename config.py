@@ -1,12 +1,19 @@
 """
 Configuration management for HandControl / Minority Report
 """
+from dataclasses import make_dataclass
 from typing import Dict, Any, Optional
+import json
 import yaml
 import os
 import sys
 from pathlib import Path
 
+# Prefer the LibYAML C implementation when available — it is several times
+# faster than the pure-Python loader/dumper and shaves startup time.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class Config:
     """Configuration manager"""
@@ -87,8 +94,14 @@ class Config:
     }
 
     def __init__(self, config_path: Optional[str] = None):
-        self.config = self._deep_copy(self.DEFAULT_CONFIG)
+        # json round-trip is several times faster than copy.deepcopy for a
+        # pure-JSON-compatible dict, and the serialization happens once at
+        # import (see _DEFAULT_JSON below the class body).
+        self.config = json.loads(_DEFAULT_JSON)
         self.config_path = config_path
+        # Memoized key_path -> tuple-of-keys splits for get()/get_ref()
+        self._path_cache: Dict[str, tuple] = {}
+        self._frozen = None
 
         if config_path and os.path.exists(config_path):
             self.load_from_file(config_path)
@@ -98,29 +111,77 @@ class Config:
                 'macos' if sys.platform == 'darwin' else 'linux'
             )
 
-    def _deep_copy(self, d: Dict) -> Dict:
-        import copy
-        return copy.deepcopy(d)
-
     def load_from_file(self, config_path: str) -> None:
         try:
-            with open(config_path, 'r') as f:
-                user_config = yaml.safe_load(f)
+            user_config = self._load_cached(config_path)
+            if user_config is None:
+                with open(config_path, 'r') as f:
+                    user_config = yaml.load(f, Loader=_YAML_LOADER)
+                self._write_cache(config_path, user_config)
             if user_config:
                 self._deep_merge(self.config, user_config)
+                self._frozen = None
         except Exception as e:
             print(f"Warning: Could not load config from {config_path}: {e}")
 
+    # In-process parse memo: path -> (mtime_ns, parsed dict). Repeated loads
+    # of an unchanged file (config watcher, GUI round-trips) skip even the
+    # sidecar read.
+    _mem_cache: Dict[str, tuple] = {}
+
+    def _load_cached(self, config_path: str) -> Optional[Dict[str, Any]]:
+        """Load the parsed-config sidecar cache if it is newer than the YAML."""
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
+            return None
+        cached = Config._mem_cache.get(config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            # Deep-copy so callers merging/mutating the result can never
+            # corrupt the memoized parse (still far cheaper than re-parsing).
+            import copy
+            return copy.deepcopy(cached[1])
+        cache_path = config_path + '.cache'
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(config_path):
+                import pickle
+                with open(cache_path, 'rb') as f:
+                    parsed = pickle.load(f)
+                import copy
+                Config._mem_cache[config_path] = (mtime_ns, copy.deepcopy(parsed))
+                return parsed
+        except Exception:
+            pass
+        return None
+
+    def _write_cache(self, config_path: str, parsed: Any) -> None:
+        """Write the parsed config to a sidecar cache (atomic rename)."""
+        cache_path = config_path + '.cache'
+        try:
+            import pickle
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            import copy
+            Config._mem_cache[config_path] = (
+                os.stat(config_path).st_mtime_ns, copy.deepcopy(parsed))
+        except Exception:
+            pass  # Cache is best-effort; YAML remains the source of truth
+
     def save_to_file(self, config_path: str) -> None:
         try:
             os.makedirs(os.path.dirname(config_path) or '.', exist_ok=True)
             with open(config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+                yaml.dump(self.config, f, Dumper=_YAML_DUMPER,
+                          default_flow_style=False, indent=2)
         except Exception as e:
             print(f"Error saving config to {config_path}: {e}")
 
     def get(self, key_path: str, default: Any = None) -> Any:
-        keys = key_path.split('.')
+        keys = self._path_cache.get(key_path)
+        if keys is None:
+            keys = self._path_cache.setdefault(key_path, tuple(key_path.split('.')))
         value = self.config
         for key in keys:
             if isinstance(value, dict) and key in value:
@@ -129,6 +190,20 @@ class Config:
                 return default
         return value
 
+    def get_ref(self, key_path: str):
+        """Return a zero-arg closure reading the value at ``key_path``.
+
+        Hot loops can cache the closure and skip the split and dict walk on
+        every frame. The closure stays live across set() on the same leaf,
+        but must be re-fetched if intermediate dicts are replaced wholesale.
+        """
+        keys = key_path.split('.')
+        container = self.config
+        for key in keys[:-1]:
+            container = container[key]
+        leaf = keys[-1]
+        return lambda: container[leaf]
+
     def set(self, key_path: str, value: Any) -> None:
         keys = key_path.split('.')
         target = self.config
@@ -137,13 +212,58 @@ class Config:
                 target[key] = {}
             target = target[key]
         target[keys[-1]] = value
+        self._frozen = None
+
+    @property
+    def frozen(self):
+        """Immutable attribute-access view of the config.
+
+        Attribute fetch on a frozen __slots__ dataclass is a C-level slot
+        read — no string split, no dict walk — so hot loops should read
+        e.g. ``cfg.frozen.gestures.finger_threshold``. Rebuilt lazily after
+        set(); dicts with non-identifier keys (keyboard shortcut tables)
+        stay plain dicts.
+        """
+        if self._frozen is None:
+            self._frozen = _to_frozen('ConfigView', self.config)
+        return self._frozen
 
     def _deep_merge(self, base: Dict, update: Dict) -> None:
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        # Iterative merge with an explicit stack — no per-level Python call
+        # overhead when hot-reload merges run repeatedly. type() is exact
+        # here (YAML only ever yields plain dicts), avoiding the MRO walk
+        # isinstance does.
+        stack = [(base, update)]
+        while stack:
+            b, u = stack.pop()
+            for key, value in u.items():
+                bv = b.get(key)
+                if type(bv) is dict and type(value) is dict:
+                    stack.append((bv, value))
+                else:
+                    b[key] = value
+
+
+def _to_frozen(name: str, d: Dict[str, Any]):
+    """Recursively turn a config dict into a frozen dataclass.
+
+    No slots=True — that make_dataclass parameter is 3.10+ and the
+    project supports 3.8; the frozen dataclass alone already gives
+    direct attribute reads instead of per-lookup dict gets.
+    """
+    if not all(type(k) is str and k.isidentifier() for k in d):
+        return dict(d)
+    values = {
+        k: _to_frozen(k.title().replace('_', ''), v) if type(v) is dict else v
+        for k, v in d.items()
+    }
+    cls = make_dataclass(name, list(values), frozen=True)
+    return cls(**values)
+
+
+# Serialized once at import; each Config() deserializes a fresh deep copy
+# so instances can never alias (and mutate) the class-level defaults.
+_DEFAULT_JSON = json.dumps(Config.DEFAULT_CONFIG)
 
 
 _global_config: Optional[Config] = None
@@ -1,15 +1,276 @@
 """
 Cursor control with smoothing, calibration, and window management.
 """
+import math
 import time
 import platform
 from typing import Tuple, Optional
+import numpy as np
 import pyautogui
 
-from smoothing import PointSmoother
+from smoothing import PointSmoother, NUMBA_AVAILABLE
 from config import Config
 from calibration import ScreenCalibrator
 
+if NUMBA_AVAILABLE:
+    from numba import njit
+    from smoothing import _one_euro_step
+
+    @njit(cache=True, fastmath=True)
+    def _cursor_tick(params, state, sx, sy, t):
+        """Fused per-frame kernel: One-Euro step, gain, clamp, truncate.
+
+        params: [sensitivity, gain_mode (0 none / 1 linear / 2 accel),
+                 sw1, sh1, inv_accel_dist, freq, mincutoff, beta, dcutoff]
+        state:  One-Euro state (7 slots, see _one_euro_step) followed by
+                [last_x, last_y, has_last]
+        """
+        fx, fy = _one_euro_step(state[:7], sx, sy, t,
+                                params[5], params[6], params[7], params[8])
+        mode = params[1]
+        if mode != 0.0 and state[9] != 0.0:
+            lx, ly = state[7], state[8]
+            dx = fx - lx
+            dy = fy - ly
+            if mode == 2.0:
+                gain = params[0] * (
+                    1.0 + min(math.hypot(dx, dy) * params[4], 1.0))
+            else:
+                gain = params[0]
+            fx = lx + dx * gain
+            fy = ly + dy * gain
+        if fx < 0.0:
+            fx = 0.0
+        elif fx > params[2]:
+            fx = params[2]
+        if fy < 0.0:
+            fy = 0.0
+        elif fy > params[3]:
+            fy = params[3]
+        state[7], state[8], state[9] = fx, fy, 1.0
+        return int(fx), int(fy), fx, fy
+
+
+# Gain functions, one of which is bound per instance in __init__ so the
+# per-frame path is a single indirect call with no config branches.
+def _no_gain(last, x, y, sensitivity):
+    return x, y
+
+
+def _linear_gain(last, x, y, sensitivity):
+    if last is None:
+        return x, y
+    lx, ly = last
+    return lx + (x - lx) * sensitivity, ly + (y - ly) * sensitivity
+
+
+# Reciprocal of the speed (px/frame) at which acceleration saturates,
+# folded so the gain computation is multiply-only
+_INV_ACCEL_DIST = 1.0 / 300.0
+
+# Acceleration curve LUT indexed by squared distance (px^2) — no sqrt on
+# the hot path. 64k entries cover deltas up to 256 px/frame; faster moves
+# fall through to the exact formula.
+_ACCEL_LUT = np.minimum(
+    2.0, 1.0 + np.sqrt(np.arange(65536)) * _INV_ACCEL_DIST
+).astype(np.float32)
+
+
+def _accel_gain(last, x, y, sensitivity):
+    if last is None:
+        return x, y
+    lx, ly = last
+    dx = x - lx
+    dy = y - ly
+    # Gain ramps with speed up to 2x so small corrections stay precise
+    # while large sweeps cover the screen
+    d2 = dx * dx + dy * dy
+    if d2 < 65536.0:
+        gain = sensitivity * float(_ACCEL_LUT[int(d2)])
+    else:
+        gain = sensitivity * (
+            1.0 + min(math.hypot(dx, dy) * _INV_ACCEL_DIST, 1.0))
+    return lx + dx * gain, ly + dy * gain
+
+
+def _make_actions(get_pos):
+    """Bind native click/scroll primitives, mirroring _make_mover.
+
+    Each pyautogui action re-checks FAILSAFE/PAUSE and goes through its
+    platform wrapper per call; these objects post the OS events directly.
+    ``get_pos`` supplies the current cursor position for event constructors
+    that need one. Returns None when no native backend is available, in
+    which case the controller keeps using pyautogui.
+    """
+    system = platform.system()
+    if system == 'Darwin':
+        try:
+            from Quartz import (CGEventCreateMouseEvent, CGEventPost,
+                                CGEventCreateScrollWheelEvent,
+                                CGEventSetIntegerValueField,
+                                kCGEventLeftMouseDown, kCGEventLeftMouseUp,
+                                kCGEventRightMouseDown, kCGEventRightMouseUp,
+                                kCGHIDEventTap, kCGMouseButtonLeft,
+                                kCGMouseButtonRight, kCGMouseEventClickState,
+                                kCGScrollEventUnitLine)
+        except ImportError:
+            return None
+
+        class _MacActions:
+            @staticmethod
+            def _post(kind, button, click_state=1):
+                event = CGEventCreateMouseEvent(
+                    None, kind, get_pos(), button)
+                # Cocoa apps read the click count off the event, so
+                # every button event needs an explicit state (2 marks
+                # the second click of a double-click).
+                CGEventSetIntegerValueField(
+                    event, kCGMouseEventClickState, click_state)
+                CGEventPost(kCGHIDEventTap, event)
+
+            def click(self, button):
+                if button == 'left':
+                    self._post(kCGEventLeftMouseDown, kCGMouseButtonLeft)
+                    self._post(kCGEventLeftMouseUp, kCGMouseButtonLeft)
+                else:
+                    self._post(kCGEventRightMouseDown, kCGMouseButtonRight)
+                    self._post(kCGEventRightMouseUp, kCGMouseButtonRight)
+
+            def double_click(self):
+                self.click('left')
+                self._post(kCGEventLeftMouseDown, kCGMouseButtonLeft, 2)
+                self._post(kCGEventLeftMouseUp, kCGMouseButtonLeft, 2)
+
+            def mouse_down(self):
+                self._post(kCGEventLeftMouseDown, kCGMouseButtonLeft)
+
+            def mouse_up(self):
+                self._post(kCGEventLeftMouseUp, kCGMouseButtonLeft)
+
+            @staticmethod
+            def scroll(amount):
+                CGEventPost(kCGHIDEventTap, CGEventCreateScrollWheelEvent(
+                    None, kCGScrollEventUnitLine, 1, amount))
+
+        return _MacActions()
+
+    if system == 'Windows':
+        import ctypes
+        user32 = ctypes.windll.user32
+        LEFTDOWN, LEFTUP = 0x0002, 0x0004
+        RIGHTDOWN, RIGHTUP = 0x0008, 0x0010
+        WHEEL = 0x0800
+
+        class _WinActions:
+            @staticmethod
+            def click(button):
+                if button == 'left':
+                    user32.mouse_event(LEFTDOWN, 0, 0, 0, 0)
+                    user32.mouse_event(LEFTUP, 0, 0, 0, 0)
+                else:
+                    user32.mouse_event(RIGHTDOWN, 0, 0, 0, 0)
+                    user32.mouse_event(RIGHTUP, 0, 0, 0, 0)
+
+            def double_click(self):
+                self.click('left')
+                self.click('left')
+
+            @staticmethod
+            def mouse_down():
+                user32.mouse_event(LEFTDOWN, 0, 0, 0, 0)
+
+            @staticmethod
+            def mouse_up():
+                user32.mouse_event(LEFTUP, 0, 0, 0, 0)
+
+            @staticmethod
+            def scroll(amount):
+                user32.mouse_event(WHEEL, 0, 0, amount * 120, 0)
+
+        return _WinActions()
+
+    if system == 'Linux':
+        try:
+            from Xlib.display import Display
+            from Xlib.ext import xtest
+            from Xlib import X
+            disp = Display()
+        except Exception:
+            return None
+
+        class _XActions:
+            def click(self, button):
+                b = 1 if button == 'left' else 3
+                xtest.fake_input(disp, X.ButtonPress, b)
+                xtest.fake_input(disp, X.ButtonRelease, b)
+                disp.sync()
+
+            def double_click(self):
+                self.click('left')
+                self.click('left')
+
+            @staticmethod
+            def mouse_down():
+                xtest.fake_input(disp, X.ButtonPress, 1)
+                disp.sync()
+
+            @staticmethod
+            def mouse_up():
+                xtest.fake_input(disp, X.ButtonRelease, 1)
+                disp.sync()
+
+            @staticmethod
+            def scroll(amount):
+                b = 4 if amount > 0 else 5
+                for _ in range(abs(amount)):
+                    xtest.fake_input(disp, X.ButtonPress, b)
+                    xtest.fake_input(disp, X.ButtonRelease, b)
+                disp.sync()
+
+        return _XActions()
+
+    return None
+
+
+def _make_mover():
+    """Bind the cheapest available mouse-move primitive for this platform.
+
+    pyautogui.moveTo revalidates coordinates, honors PAUSE and goes through
+    several wrapper layers on every call; at 60 Hz that overhead dominates
+    the move itself. Falls back to pyautogui when the native API is not
+    importable (or no display is available).
+    """
+    system = platform.system()
+    if system == 'Darwin':
+        try:
+            from Quartz import (CGEventCreateMouseEvent, CGEventPost,
+                                kCGEventMouseMoved, kCGHIDEventTap,
+                                kCGMouseButtonLeft)
+        except ImportError:
+            pass
+        else:
+            def _move(x: float, y: float) -> None:
+                CGEventPost(kCGHIDEventTap, CGEventCreateMouseEvent(
+                    None, kCGEventMouseMoved, (x, y), kCGMouseButtonLeft))
+            return _move
+    elif system == 'Windows':
+        import ctypes
+        user32 = ctypes.windll.user32
+        return lambda x, y: user32.SetCursorPos(int(x), int(y))
+    elif system == 'Linux':
+        try:
+            from Xlib.display import Display
+            disp = Display()
+            root = disp.screen().root
+        except Exception:
+            pass
+        else:
+            def _move(x: float, y: float) -> None:
+                root.warp_pointer(int(x), int(y))
+                disp.sync()
+            return _move
+    return lambda x, y: pyautogui.moveTo(int(x), int(y), _pause=False)
+
 
 class CursorController:
     """Maps finger position to screen coordinates with smoothing and calibration."""
@@ -23,6 +284,27 @@ class CursorController:
         self.dead_zone_x = dead_zone
         self.dead_zone_y = dead_zone
 
+        # Dead-zone remap constants, folded once — the scalar hot path is
+        # then two multiplies and a clamp per axis with no divisions
+        self._lo_x = self.dead_zone_x
+        self._hi_x = 1.0 - self.dead_zone_x
+        self._inv_span_x = 1.0 / (1.0 - 2 * self.dead_zone_x)
+        self._lo_y = self.dead_zone_y
+        self._hi_y = 1.0 - self.dead_zone_y
+        self._inv_span_y = 1.0 / (1.0 - 2 * self.dead_zone_y)
+
+        # Constant vectors for the batch remap path — computed once so
+        # webcam_to_screen_batch is pure ufunc work with no per-call setup
+        self._dz_offset = np.array([self.dead_zone_x, self.dead_zone_y],
+                                   dtype=np.float32)
+        self._dz_scale = np.array([1.0 / (1.0 - 2 * self.dead_zone_x),
+                                   1.0 / (1.0 - 2 * self.dead_zone_y)],
+                                  dtype=np.float32)
+        self._dz_hi = 1.0 - self._dz_offset
+        # Scratch for webcam_to_screen_batch — 64 rows covers 2 hands x 21
+        # landmarks with headroom, so typical batches allocate nothing
+        self._scratch_xy = np.empty((64, 2), dtype=np.float32)
+
         smoothing_cfg = config.get('smoothing', {})
         stype = smoothing_cfg.get('type', 'one_euro')
 
@@ -40,14 +322,55 @@ class CursorController:
 
         self.sensitivity = config.get('cursor.sensitivity', 1.0)
         self.use_acceleration = config.get('cursor.acceleration_curve', True)
+        if self.use_acceleration:
+            self._apply_gain = _accel_gain
+            gain_mode = 2.0
+        elif self.sensitivity != 1.0:
+            self._apply_gain = _linear_gain
+            gain_mode = 1.0
+        else:
+            self._apply_gain = _no_gain
+            gain_mode = 0.0
+
+        # Fused numba tick: one kernel call replaces the staged
+        # smooth/gain/clamp Python code below when available
+        self._tick_state = None
+        if NUMBA_AVAILABLE and stype == 'one_euro':
+            f = self.smoother.x_smoother
+            self._tick_params = np.array(
+                [self.sensitivity, gain_mode,
+                 float(self.screen_width - 1), float(self.screen_height - 1),
+                 _INV_ACCEL_DIST, f.freq, f.mincutoff, f.beta, f.dcutoff])
+            self._tick_state = np.zeros(10)
+            _cursor_tick(self._tick_params, np.zeros(10), 0.0, 0.0, 0.0)
         self.is_macos = platform.system() == 'Darwin'
+        # Platform key remap, built once — keyboard_shortcut is then one
+        # dict lookup per key instead of an if/elif chain
+        if self.is_macos:
+            self._key_map = {'ctrl': 'cmd'}
+        else:
+            self._key_map = {'cmd': 'ctrl', 'command': 'ctrl'}
 
         pyautogui.FAILSAFE = True
         pyautogui.PAUSE = 0  # No pause between actions for speed
+        self._move = _make_mover()
+        # Before the first MOVE there is no tracked position — fall back
+        # to the OS pointer so an early click lands where the cursor is,
+        # not at the screen corner.
+        self._actions = _make_actions(
+            lambda: self.last_position or tuple(pyautogui.position()))
 
         self.last_position: Optional[Tuple[float, float]] = None
+        # Last pixel actually posted to the OS (-1 = none yet); kept as two
+        # plain ints so the per-frame guard allocates nothing
+        self._last_ix = -1
+        self._last_iy = -1
         self.is_dragging = False
         self.calibrator = calibrator
+        self._screen = np.array([self.screen_width, self.screen_height],
+                                dtype=np.float32)
+        self._sw1 = self.screen_width - 1
+        self._sh1 = self.screen_height - 1
 
     def webcam_to_screen(self, norm_x: float, norm_y: float) -> Tuple[float, float]:
         """Convert normalized webcam coords (0-1) to screen coords."""
@@ -55,46 +378,123 @@ class CursorController:
         if self.calibrator and self.calibrator.is_complete():
             mapped_x, mapped_y = self.calibrator.map_point(norm_x, norm_y)
         else:
-            # Dead zone mapping
-            eff_x = max(self.dead_zone_x, min(1.0 - self.dead_zone_x, norm_x))
-            eff_y = max(self.dead_zone_y, min(1.0 - self.dead_zone_y, norm_y))
-            mapped_x = (eff_x - self.dead_zone_x) / (1.0 - 2 * self.dead_zone_x)
-            mapped_y = (eff_y - self.dead_zone_y) / (1.0 - 2 * self.dead_zone_y)
+            # Dead zone mapping with constants folded in __init__
+            eff_x = max(self._lo_x, min(self._hi_x, norm_x))
+            eff_y = max(self._lo_y, min(self._hi_y, norm_y))
+            mapped_x = (eff_x - self._lo_x) * self._inv_span_x
+            mapped_y = (eff_y - self._lo_y) * self._inv_span_y
 
         return mapped_x * self.screen_width, mapped_y * self.screen_height
 
-    def move_cursor(self, norm_x: float, norm_y: float) -> None:
-        """Move cursor using normalized coordinates (0-1)."""
+    def webcam_to_screen_batch(self, coords: np.ndarray) -> np.ndarray:
+        """Vectorized webcam_to_screen for an (N, 2) array of normalized coords.
+
+        One pass of NumPy ufuncs instead of N scalar calls — useful when
+        converting several landmarks (multi-hand) in a single frame. The
+        returned array is a view into an internal scratch buffer, valid
+        until the next call.
+        """
+        if self.calibrator and self.calibrator.is_complete():
+            return self.calibrator.map_points(coords) * self._screen
+        n = coords.shape[0]
+        if n <= self._scratch_xy.shape[0]:
+            out = self._scratch_xy[:n]
+        else:
+            out = np.empty((n, 2), dtype=np.float32)
+        np.copyto(out, coords)
+        np.clip(out, self._dz_offset, self._dz_hi, out=out)
+        out -= self._dz_offset
+        out *= self._dz_scale
+        out *= self._screen
+        return out
+
+    def move_cursor(self, norm_x: float, norm_y: float,
+                    timestamp: Optional[float] = None) -> None:
+        """Move cursor using normalized coordinates (0-1).
+
+        ``timestamp`` (monotonic seconds, e.g. taken right after the camera
+        read) saves the filter its own clock query and gives a more honest
+        dt than the time this method happens to run.
+        """
         screen_x, screen_y = self.webcam_to_screen(norm_x, norm_y)
-        smooth_x, smooth_y = self.smoother.filter((screen_x, screen_y))
 
-        # Clamp
-        smooth_x = max(0, min(self.screen_width - 1, smooth_x))
-        smooth_y = max(0, min(self.screen_height - 1, smooth_y))
+        if self._tick_state is not None:
+            if timestamp is None:
+                timestamp = time.perf_counter_ns() * 1e-9
+            ix, iy, smooth_x, smooth_y = _cursor_tick(
+                self._tick_params, self._tick_state,
+                screen_x, screen_y, timestamp)
+        else:
+            smooth_x, smooth_y = self.smoother.filter_xy(
+                screen_x, screen_y, timestamp)
+            smooth_x, smooth_y = self._apply_gain(
+                self.last_position, smooth_x, smooth_y, self.sensitivity)
+
+            # Ternary clamp — cheaper than the max(0, min(...)) call pair
+            smooth_x = 0.0 if smooth_x < 0.0 else (
+                self._sw1 if smooth_x > self._sw1 else smooth_x)
+            smooth_y = 0.0 if smooth_y < 0.0 else (
+                self._sh1 if smooth_y > self._sh1 else smooth_y)
 
-        pyautogui.moveTo(int(smooth_x), int(smooth_y), _pause=False)
+            ix = int(smooth_x)
+            iy = int(smooth_y)
+
+        # Skip the OS event entirely when the change is sub-pixel — on
+        # still-hand frames this drops most cursor syscalls.
+        if ix != self._last_ix or iy != self._last_iy:
+            self._move(ix, iy)
+            self._last_ix = ix
+            self._last_iy = iy
         self.last_position = (smooth_x, smooth_y)
 
+    def move_cursor_from_landmarks(self, landmarks_xyz: np.ndarray,
+                                   tip_idx: int = 8) -> None:
+        """Move the cursor from a (21, 3) landmark array.
+
+        Indexes the fingertip row directly (see HandLandmarks.as_array),
+        avoiding the per-frame tuple construction of the get_landmark path.
+        """
+        self.move_cursor(float(landmarks_xyz[tip_idx, 0]),
+                         float(landmarks_xyz[tip_idx, 1]))
+
     def left_click(self) -> None:
-        pyautogui.click(button='left')
+        if self._actions:
+            self._actions.click('left')
+        else:
+            pyautogui.click(button='left')
 
     def right_click(self) -> None:
-        pyautogui.click(button='right')
+        if self._actions:
+            self._actions.click('right')
+        else:
+            pyautogui.click(button='right')
 
     def double_click(self) -> None:
-        pyautogui.doubleClick()
+        if self._actions:
+            self._actions.double_click()
+        else:
+            pyautogui.doubleClick()
 
     def scroll(self, direction: int, amount: int = 1) -> None:
-        pyautogui.scroll(amount * direction)
+        if self._actions:
+            self._actions.scroll(amount * direction)
+        else:
+            pyautogui.scroll(amount * direction)
 
     def start_drag(self) -> None:
         if not self.is_dragging:
-            pyautogui.mouseDown()
+            if self._actions:
+                self._actions.mouse_down()
+            else:
+                pyautogui.mouseDown()
             self.is_dragging = True
 
     def stop_drag(self) -> None:
         if self.is_dragging:
-            pyautogui.mouseUp()
+            if self._actions:
+                self._actions.mouse_up()
+            else:
+                pyautogui.mouseUp()
             self.is_dragging = False
 
     def toggle_drag(self) -> None:
@@ -104,17 +504,13 @@ class CursorController:
             self.start_drag()
 
     def keyboard_shortcut(self, keys: list) -> None:
-        platform_keys = []
-        for key in keys:
-            k = key.lower()
-            if k in ('cmd', 'command') and not self.is_macos:
-                platform_keys.append('ctrl')
-            elif k == 'ctrl' and self.is_macos:
-                platform_keys.append('cmd')
-            else:
-                platform_keys.append(key)
-        pyautogui.hotkey(*platform_keys)
+        get = self._key_map.get
+        pyautogui.hotkey(*[get(k.lower(), k) for k in keys])
 
     def reset_smoothing(self) -> None:
         self.smoother.reset()
+        if self._tick_state is not None:
+            self._tick_state[:] = 0.0
         self.last_position = None
+        self._last_ix = -1
+        self._last_iy = -1
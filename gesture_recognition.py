@@ -4,44 +4,121 @@ Two-hand support, grab/resize gestures, relative thresholds.
 """
 import time
 import math
+import threading
 from typing import Optional, Dict, Any, List, Tuple
-from enum import Enum
-from collections import deque
+from enum import IntEnum
+
+import numpy as np
 
 try:
     from hand_tracker import HandLandmarks, HandTrackingResult
 except ImportError:
     pass
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
-class GestureType(Enum):
-    IDLE = "idle"
-    MOVE = "move"
-    LEFT_CLICK = "left_click"
-    RIGHT_CLICK = "right_click"
-    DOUBLE_CLICK = "double_click"
-    SCROLL = "scroll"
-    DRAG = "drag"
-    KEYBOARD = "keyboard"
-    GRAB = "grab"
-    WINDOW_MOVE = "window_move"
-    WINDOW_MINIMIZE = "window_minimize"
-    WINDOW_MAXIMIZE = "window_maximize"
-    TWO_HAND_RESIZE = "two_hand_resize"
+# Constant index vectors for the vectorized finger checks
+_TIP_IDX = np.array([4, 8, 12, 16, 20])
+_PIP_IDX = np.array([3, 6, 10, 14, 18])
+_THUMB_MASK = np.array([True, False, False, False, False])
+_POW2 = np.array([1, 2, 4, 8, 16])
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _pose_kernel(xy, finger_thr, pinch_thr_sq):
+        """Pure-geometry half of recognition, compiled to one native call.
+
+        Takes the (21, 2) landmark array and the per-frame thresholds and
+        returns (finger_mask, pinch_index_middle, pinch_thumb_index). The
+        stateful parts (keyboard hold, grab machine, scroll deltas) stay in
+        Python where they belong.
+
+        Kept to branch-free-able scalar float math on purpose: it would
+        port line for line to a cdef Cython function if this project ever
+        grows a compiled-extension build.
+        """
+        mask = 0
+        if abs(xy[4, 0] - xy[3, 0]) > finger_thr:    # thumb measured on x
+            mask |= 1
+        if xy[6, 1] - xy[8, 1] > finger_thr:
+            mask |= 2
+        if xy[10, 1] - xy[12, 1] > finger_thr:
+            mask |= 4
+        if xy[14, 1] - xy[16, 1] > finger_thr:
+            mask |= 8
+        if xy[18, 1] - xy[20, 1] > finger_thr:
+            mask |= 16
+        dx = xy[8, 0] - xy[12, 0]
+        dy = xy[8, 1] - xy[12, 1]
+        pinch_im = dx * dx + dy * dy < pinch_thr_sq
+        dx = xy[4, 0] - xy[8, 0]
+        dy = xy[4, 1] - xy[8, 1]
+        pinch_ti = dx * dx + dy * dy < pinch_thr_sq
+        return mask, pinch_im, pinch_ti
+
+
+class GestureType(IntEnum):
+    # Small ints so comparisons and (1 << type) mask tests stay cheap;
+    # use .name for display strings
+    IDLE = 0
+    MOVE = 1
+    LEFT_CLICK = 2
+    RIGHT_CLICK = 3
+    DOUBLE_CLICK = 4
+    SCROLL = 5
+    DRAG = 6
+    KEYBOARD = 7
+    GRAB = 8
+    WINDOW_MOVE = 9
+    WINDOW_MINIMIZE = 10
+    WINDOW_MAXIMIZE = 11
+    TWO_HAND_RESIZE = 12
+
+
+# Shared payload for states with no data — treat as read-only. Saves one
+# dict allocation per frame on the common IDLE path.
+_EMPTY_DATA: Dict[str, Any] = {}
 
 
 class GestureState:
+    __slots__ = ('gesture_type', 'confidence', 'data', 'timestamp')
+
     def __init__(self, gesture_type: GestureType, confidence: float = 1.0,
-                 data: Optional[Dict[str, Any]] = None):
+                 data: Optional[Dict[str, Any]] = None,
+                 timestamp: Optional[float] = None):
         self.gesture_type = gesture_type
         self.confidence = confidence
-        self.data = data or {}
-        self.timestamp = time.time()
+        self.data = data if data is not None else _EMPTY_DATA
+        self.timestamp = timestamp if timestamp is not None else time.time()
 
 
 class GestureRecognizer:
     """Hand gesture recognition with two-hand and window management support."""
 
+    # Finger poses packed into a bitmask: thumb = bit 0 ... pinky = bit 4.
+    # Exact poses compare with ==; poses that ignore the thumb mask it off
+    # with _MASK_NO_THUMB first.
+    MASK_NONE = 0b00000
+    MASK_DRAG = 0b00001
+    MASK_MOVE = 0b00010
+    MASK_LEFT_CLICK = 0b00110
+    MASK_RIGHT_CLICK = 0b01110
+    MASK_ALL = 0b11111
+    _MASK_NO_THUMB = 0b11110
+
+    # Gesture types that share the click cooldown, as a bitmask over the
+    # integer GestureType values — one AND instead of a tuple membership
+    # test per frame
+    _CLICK_MASK = ((1 << GestureType.LEFT_CLICK)
+                   | (1 << GestureType.RIGHT_CLICK)
+                   | (1 << GestureType.DOUBLE_CLICK))
+
     def __init__(self,
                  finger_threshold: float = 0.15,
                  pinch_threshold: float = 0.08,
@@ -62,7 +139,10 @@ class GestureRecognizer:
         self.grab_velocity_threshold = grab_velocity_threshold
         self.dominant_hand = dominant_hand
 
-        self.gesture_history: deque = deque(maxlen=stability_frames)
+        # Stability tracking: "same type for the last N frames" only needs
+        # the current run length, not a history buffer
+        self._last_type: Optional[GestureType] = None
+        self._run_len = 0
         self.stable_gesture: Optional[GestureState] = None
         self.last_click_time = 0.0
         self.last_scroll_time = 0.0
@@ -83,60 +163,157 @@ class GestureRecognizer:
         # Scroll tracking
         self._prev_scroll_y: Optional[float] = None
 
+        # One-entry hand-size cache keyed on the wrist/middle-MCP
+        # signature; see _hand_size_cached
+        self._size_sig: Optional[Tuple[float, float, float, float, float]] = None
+
+        # Thresholds are fixed after construction, so specialize the
+        # per-frame derivation as a closure over the constants — no
+        # attribute loads and the pinch threshold is pre-squared
+        ft = self.finger_threshold
+        pt_sq = self.pinch_threshold * self.pinch_threshold
+        self._pinch_threshold_sq = pt_sq
+        self._thresholds_for = \
+            lambda hs: (ft * hs, pt_sq * hs * hs)
+
+        if NUMBA_AVAILABLE:
+            # Warm the pose kernel for both layouts it will see — the
+            # tracker hands out a strided (21, 3) column slice, mocks a
+            # contiguous array — so compilation never lands on a frame
+            warm = np.zeros((21, 3), dtype=np.float32)
+            _pose_kernel(warm[:, :2], 0.1, 0.01)
+            _pose_kernel(np.zeros((21, 2), dtype=np.float32), 0.1, 0.01)
+
+        # Finger-mask dispatch table: one dict lookup replaces the old
+        # if/elif cascade. Poses that ignore the thumb register both
+        # variants so the lookup stays a single probe on the full mask.
+        self._dispatch = {
+            self.MASK_MOVE: self._handle_move,
+            self.MASK_LEFT_CLICK: self._handle_click_or_scroll,
+            self.MASK_LEFT_CLICK | self.MASK_DRAG: self._handle_click_or_scroll,
+            self.MASK_RIGHT_CLICK: self._handle_right_click,
+            self.MASK_RIGHT_CLICK | self.MASK_DRAG: self._handle_right_click,
+            self.MASK_DRAG: self._handle_drag,
+        }
+
     @staticmethod
     def _euclidean(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
         return math.sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
 
-    def _fingers_extended(self, landmarks: 'HandLandmarks', hand_size: float) -> List[bool]:
-        """Check which of the 5 fingers are extended."""
-        tips = [4, 8, 12, 16, 20]
-        pips = [3, 6, 10, 14, 18]
-        threshold = self.finger_threshold * hand_size
-        extended = []
-        for tip_idx, pip_idx in zip(tips, pips):
-            tip = landmarks[tip_idx]
-            pip_ = landmarks[pip_idx]
-            if tip_idx == 4:  # Thumb
-                distance = abs(tip.x - pip_.x)
-            else:
-                distance = pip_.y - tip.y
-            extended.append(distance > threshold)
-        return extended
-
-    def _is_fist(self, landmarks: 'HandLandmarks', hand_size: float) -> bool:
-        """All fingers curled (fist)."""
-        ext = self._fingers_extended(landmarks, hand_size)
-        return not any(ext)
-
-    def _detect_pinch(self, landmarks: 'HandLandmarks',
-                      idx1: int, idx2: int, hand_size: float) -> bool:
-        p1, p2 = landmarks[idx1], landmarks[idx2]
-        dist = self._euclidean((p1.x, p1.y), (p2.x, p2.y))
-        return dist < self.pinch_threshold * hand_size
-
-    def _recognize_single_hand(self, landmarks: 'HandLandmarks') -> GestureState:
-        """Recognize gesture from a single hand."""
+    def _hand_size_cached(self, landmarks: 'HandLandmarks',
+                          xy: np.ndarray) -> float:
+        """Hand size with a one-entry cache across frames.
+
+        When the hand holds still — exactly the case while KEYBOARD mode
+        builds up — the wrist and middle MCP barely move between frames,
+        so the previous sqrt is reused whenever their L1 drift stays
+        under 1e-4. Coordinates come from the per-frame array, keeping
+        this off the landmark-object path.
+        """
+        wx, wy = float(xy[0, 0]), float(xy[0, 1])
+        mx, my = float(xy[9, 0]), float(xy[9, 1])
+        sig = self._size_sig
+        if sig is not None and (abs(wx - sig[0]) + abs(wy - sig[1])
+                                + abs(mx - sig[2]) + abs(my - sig[3])) < 1e-4:
+            return sig[4]
         hand_size = landmarks.get_hand_size()
-        fingers = self._fingers_extended(landmarks, hand_size)
-        thumb, index, middle, ring, pinky = fingers
-        ext_count = sum(fingers)
-
-        # KEYBOARD: All 5 fingers open, held for keyboard_hold_time
-        if all(fingers):
-            self._was_open_hand = True
-            if self.keyboard_mode_start is None:
-                self.keyboard_mode_start = time.time()
-            elif time.time() - self.keyboard_mode_start >= self.keyboard_hold_time:
-                return GestureState(GestureType.KEYBOARD, 1.0, {
-                    'hand_size': hand_size,
-                    'finger_count': 5,
-                })
-            return GestureState(GestureType.IDLE, 0.5, {'building_keyboard': True})
+        self._size_sig = (wx, wy, mx, my, hand_size)
+        return hand_size
+
+    @staticmethod
+    def _hand_size_sq(landmarks: 'HandLandmarks') -> float:
+        """Squared hand size, skipping the sqrt when the tracker offers it."""
+        get_sq = getattr(landmarks, 'get_hand_size_sq', None)
+        if get_sq is not None:
+            return get_sq()
+        hs = landmarks.get_hand_size()
+        return hs * hs
+
+    @staticmethod
+    def _landmarks_xy(landmarks: 'HandLandmarks') -> np.ndarray:
+        """(21, 2) float32 view of the landmark coordinates.
+
+        Built once per frame and reused by every check below — the tracker's
+        cached array when available, a one-shot gather otherwise.
+        """
+        as_arr = getattr(landmarks, 'as_array', None)
+        if as_arr is not None:
+            return as_arr()[:, :2]
+        return np.array([(lm.x, lm.y) for lm in landmarks.landmarks],
+                        dtype=np.float32)
+
+    @staticmethod
+    def _finger_dists(xy: np.ndarray) -> np.ndarray:
+        """Per-finger extension distances as one gather + compare over all
+        five fingers (thumb measured on x, the rest on y) instead of a
+        Python loop of attribute reads."""
+        tips = xy[_TIP_IDX]
+        pips = xy[_PIP_IDX]
+        return np.where(_THUMB_MASK,
+                        np.abs(tips[:, 0] - pips[:, 0]),
+                        pips[:, 1] - tips[:, 1])
+
+    @staticmethod
+    def _fingers_extended(xy: np.ndarray,
+                          finger_thr: float) -> Tuple[bool, ...]:
+        """Which of the 5 fingers are extended, as a (thumb, ..., pinky)
+        tuple. Diagnostic/compat helper — the hot path packs the bitmask
+        directly via _finger_mask."""
+        return tuple(
+            (GestureRecognizer._finger_dists(xy) > finger_thr).tolist())
+
+    @staticmethod
+    def _finger_mask(xy: np.ndarray, finger_thr: float) -> int:
+        """Extended fingers as a 5-bit mask (thumb = bit 0 ... pinky = bit 4).
+
+        Packed straight from the comparison vector — no intermediate
+        list, unpack, or shift chain.
+        """
+        return int((GestureRecognizer._finger_dists(xy) > finger_thr) @ _POW2)
+
+    @staticmethod
+    def _detect_pinch(xy: np.ndarray,
+                      idx1: int, idx2: int, pinch_thr_sq: float) -> bool:
+        # Compare squared distances — the sqrt adds nothing to a threshold
+        # test and this runs several times per frame. ``pinch_thr_sq`` is
+        # the squared hand-size-scaled threshold, derived once per frame.
+        dx = xy[idx1, 0] - xy[idx2, 0]
+        dy = xy[idx1, 1] - xy[idx2, 1]
+        return bool(dx * dx + dy * dy < pinch_thr_sq)
+
+    def _recognize_single_hand(self, landmarks: 'HandLandmarks',
+                               now: Optional[float] = None) -> GestureState:
+        """Recognize gesture from a single hand.
+
+        ``now`` is the frame's wall-clock time; it is captured once per
+        frame and threaded into every timer check and GestureState built
+        here, so recognition costs a single time.time() call.
+        """
+        if now is None:
+            now = time.time()
+        xy = self._landmarks_xy(landmarks)
+        hand_size = self._hand_size_cached(landmarks, xy)
+        # Hand-size-scaled thresholds, derived once per frame and threaded
+        # through the helpers below
+        finger_thr, pinch_thr_sq = self._thresholds_for(hand_size)
+        if NUMBA_AVAILABLE:
+            mask, pinch_index_middle, pinch_thumb_index = \
+                _pose_kernel(xy, finger_thr, pinch_thr_sq)
+            mask = int(mask)
         else:
-            self.keyboard_mode_start = None
+            mask = self._finger_mask(xy, finger_thr)
+            pinch_index_middle = self._detect_pinch(xy, 8, 12, pinch_thr_sq)
+            pinch_thumb_index = self._detect_pinch(xy, 4, 8, pinch_thr_sq)
+
+        # KEYBOARD: All 5 fingers open, held for keyboard_hold_time.
+        # Handled before the grab state machine, which only runs for
+        # partial poses.
+        if mask == self.MASK_ALL:
+            return self._handle_keyboard(hand_size, now)
+        self.keyboard_mode_start = None
 
         # GRAB: Transition from open hand to fist
-        is_fist = self._is_fist(landmarks, hand_size)
+        is_fist = mask == self.MASK_NONE
         palm = landmarks.get_palm_center()
 
         if is_fist and self._was_open_hand:
@@ -146,7 +323,7 @@ class GestureRecognizer:
                 self._was_open_hand = False
                 return GestureState(GestureType.GRAB, 1.0, {
                     'palm': palm, 'hand_size': hand_size
-                })
+                }, timestamp=now)
 
         if is_fist and self._grab_started:
             # Window move while grabbed
@@ -163,67 +340,163 @@ class GestureRecognizer:
                     self._was_open_hand = False
                     return GestureState(GestureType.WINDOW_MINIMIZE, 1.0, {
                         'hand_size': hand_size
-                    })
+                    }, timestamp=now)
                 elif total_dy < -self.grab_velocity_threshold:
                     self._grab_started = False
                     self._was_open_hand = False
                     return GestureState(GestureType.WINDOW_MAXIMIZE, 1.0, {
                         'hand_size': hand_size
-                    })
+                    }, timestamp=now)
 
             return GestureState(GestureType.WINDOW_MOVE, 1.0, {
                 'palm': palm, 'delta_y': delta_y, 'hand_size': hand_size
-            })
+            }, timestamp=now)
 
         if not is_fist:
             self._grab_started = False
             self._grab_start_pos = None
-            if ext_count >= 3:
+            if bin(mask).count('1') >= 3:
                 self._was_open_hand = True
 
         self._prev_palm_center = palm
 
-        # MOVE: Only index finger extended
-        if index and not middle and not ring and not pinky and not thumb:
-            pos = landmarks[8]
-            return GestureState(GestureType.MOVE, 1.0, {
-                'cursor_pos': (pos.x, pos.y), 'hand_size': hand_size
-            })
-
-        # LEFT_CLICK: Index + middle pinched
-        if index and middle and not ring and not pinky:
-            if self._detect_pinch(landmarks, 8, 12, hand_size):
-                return GestureState(GestureType.LEFT_CLICK, 1.0, {'hand_size': hand_size})
-
-        # RIGHT_CLICK: Index + middle + ring, index+middle pinched
-        if index and middle and ring and not pinky:
-            if self._detect_pinch(landmarks, 8, 12, hand_size):
-                return GestureState(GestureType.RIGHT_CLICK, 1.0, {'hand_size': hand_size})
-
-        # DOUBLE_CLICK: Thumb-index pinch
-        if self._detect_pinch(landmarks, 4, 8, hand_size):
-            return GestureState(GestureType.DOUBLE_CLICK, 1.0, {'hand_size': hand_size})
-
-        # SCROLL: Index + middle spread
-        if index and middle and not ring and not pinky:
-            if not self._detect_pinch(landmarks, 8, 12, hand_size):
-                scroll_y = (landmarks[8].y + landmarks[12].y) / 2
-                scroll_delta = 0.0
-                if self._prev_scroll_y is not None:
-                    scroll_delta = (self._prev_scroll_y - scroll_y) * 100
-                self._prev_scroll_y = scroll_y
-                return GestureState(GestureType.SCROLL, 1.0, {
-                    'scroll_y': scroll_y, 'scroll_delta': scroll_delta,
-                    'hand_size': hand_size
-                })
-        else:
-            self._prev_scroll_y = None
-
-        # DRAG: Fist with thumb out
-        if thumb and not index and not middle and not ring and not pinky:
-            return GestureState(GestureType.DRAG, 1.0, {'hand_size': hand_size})
-
-        return GestureState(GestureType.IDLE, 0.0, {'extended_fingers': ext_count})
+        handler = self._dispatch.get(mask)
+        if handler is None:
+            handler = self._handle_default
+        return handler(xy, mask, hand_size,
+                       pinch_index_middle, pinch_thumb_index, now)
+
+    def _handle_keyboard(self, hand_size: float, now: float) -> GestureState:
+        self._was_open_hand = True
+        if self.keyboard_mode_start is None:
+            self.keyboard_mode_start = now
+        elif now - self.keyboard_mode_start >= self.keyboard_hold_time:
+            return GestureState(GestureType.KEYBOARD, 1.0, {
+                'hand_size': hand_size,
+                'finger_count': 5,
+            }, timestamp=now)
+        return GestureState(GestureType.IDLE, 0.5, {'building_keyboard': True},
+                            timestamp=now)
+
+    def _handle_move(self, xy: np.ndarray, mask: int,
+                     hand_size: float, pinch_index_middle: bool,
+                     pinch_thumb_index: bool, now: float) -> GestureState:
+        """MOVE: only the index finger extended."""
+        self._prev_scroll_y = None
+        return GestureState(GestureType.MOVE, 1.0, {
+            'cursor_pos': (float(xy[8, 0]), float(xy[8, 1])),
+            'hand_size': hand_size
+        }, timestamp=now)
+
+    def _handle_click_or_scroll(self, xy: np.ndarray, mask: int,
+                                hand_size: float, pinch_index_middle: bool,
+                                pinch_thumb_index: bool,
+                                now: float) -> GestureState:
+        """Index + middle extended: pinched = left click, spread = scroll."""
+        if pinch_index_middle:
+            return GestureState(GestureType.LEFT_CLICK, 1.0,
+                                {'hand_size': hand_size}, timestamp=now)
+        if pinch_thumb_index:
+            return GestureState(GestureType.DOUBLE_CLICK, 1.0,
+                                {'hand_size': hand_size}, timestamp=now)
+        scroll_y = float(xy[8, 1] + xy[12, 1]) / 2
+        scroll_delta = 0.0
+        if self._prev_scroll_y is not None:
+            scroll_delta = (self._prev_scroll_y - scroll_y) * 100
+        self._prev_scroll_y = scroll_y
+        return GestureState(GestureType.SCROLL, 1.0, {
+            'scroll_y': scroll_y, 'scroll_delta': scroll_delta,
+            'hand_size': hand_size
+        }, timestamp=now)
+
+    def _handle_right_click(self, xy: np.ndarray, mask: int,
+                            hand_size: float, pinch_index_middle: bool,
+                            pinch_thumb_index: bool,
+                            now: float) -> GestureState:
+        """Index + middle + ring extended, index + middle pinched."""
+        self._prev_scroll_y = None
+        if pinch_index_middle:
+            return GestureState(GestureType.RIGHT_CLICK, 1.0,
+                                {'hand_size': hand_size}, timestamp=now)
+        if pinch_thumb_index:
+            return GestureState(GestureType.DOUBLE_CLICK, 1.0,
+                                {'hand_size': hand_size}, timestamp=now)
+        return GestureState(GestureType.IDLE, 0.0,
+                            {'extended_fingers': bin(mask).count('1')},
+                            timestamp=now)
+
+    def _handle_drag(self, xy: np.ndarray, mask: int,
+                     hand_size: float, pinch_index_middle: bool,
+                     pinch_thumb_index: bool, now: float) -> GestureState:
+        """DRAG: fist with thumb out (thumb-index pinch wins)."""
+        self._prev_scroll_y = None
+        if pinch_thumb_index:
+            return GestureState(GestureType.DOUBLE_CLICK, 1.0,
+                                {'hand_size': hand_size}, timestamp=now)
+        return GestureState(GestureType.DRAG, 1.0,
+                            {'hand_size': hand_size}, timestamp=now)
+
+    def _handle_default(self, xy: np.ndarray, mask: int,
+                        hand_size: float, pinch_index_middle: bool,
+                        pinch_thumb_index: bool,
+                        now: float) -> GestureState:
+        """No registered pose — thumb-index pinch is a double click."""
+        self._prev_scroll_y = None
+        if pinch_thumb_index:
+            return GestureState(GestureType.DOUBLE_CLICK, 1.0,
+                                {'hand_size': hand_size}, timestamp=now)
+        return GestureState(GestureType.IDLE, 0.0,
+                            {'extended_fingers': bin(mask).count('1')},
+                            timestamp=now)
+
+    # Codes returned by recognize_batch, indexing into this tuple
+    BATCH_GESTURES: Tuple[GestureType, ...] = (
+        GestureType.IDLE, GestureType.MOVE, GestureType.LEFT_CLICK,
+        GestureType.RIGHT_CLICK, GestureType.DOUBLE_CLICK,
+        GestureType.SCROLL, GestureType.DRAG, GestureType.KEYBOARD,
+    )
+
+    def recognize_batch(self, frames: np.ndarray) -> np.ndarray:
+        """Classify a stack of (N, 21, 2) landmark frames in one pass.
+
+        Offline/replay helper for recorded sessions: pure pose
+        classification with NumPy broadcasting over the batch dimension —
+        no Python loop and none of the temporal state (keyboard hold,
+        grab machine, cooldowns) of process_landmarks. Returns an (N,)
+        int array of indexes into BATCH_GESTURES.
+        """
+        frames = np.asarray(frames, dtype=np.float32)
+        d = frames[:, 9] - frames[:, 0]
+        hs_sq = (d * d).sum(axis=1)
+        finger_thr = self.finger_threshold * np.sqrt(hs_sq)
+        pinch_thr_sq = self._pinch_threshold_sq * hs_sq
+
+        tips = frames[:, _TIP_IDX]
+        pips = frames[:, _PIP_IDX]
+        dist = np.where(_THUMB_MASK,
+                        np.abs(tips[..., 0] - pips[..., 0]),
+                        pips[..., 1] - tips[..., 1])
+        extended = dist > finger_thr[:, None]
+        mask = (extended * _POW2).sum(axis=1)
+
+        d_im = frames[:, 8] - frames[:, 12]
+        pinch_im = (d_im * d_im).sum(axis=1) < pinch_thr_sq
+        d_ti = frames[:, 4] - frames[:, 8]
+        pinch_ti = (d_ti * d_ti).sum(axis=1) < pinch_thr_sq
+
+        # Same precedence as the per-frame dispatch handlers
+        no_thumb = mask & self._MASK_NO_THUMB
+        conditions = [
+            mask == self.MASK_ALL,
+            mask == self.MASK_MOVE,
+            (no_thumb == self.MASK_LEFT_CLICK) & pinch_im,
+            (no_thumb == self.MASK_RIGHT_CLICK) & pinch_im,
+            pinch_ti,
+            no_thumb == self.MASK_LEFT_CLICK,
+            mask == self.MASK_DRAG,
+        ]
+        codes = [7, 1, 2, 3, 4, 5, 6]
+        return np.select(conditions, codes, default=0)
 
     def process_two_hands(self, result: 'HandTrackingResult',
                           dominant: str = "Right") -> Optional[GestureState]:
@@ -240,9 +513,15 @@ class GestureRecognizer:
         if not left or not right:
             return None
 
-        # Two-hand resize: both hands pinching, distance between them = size
-        left_pinch = self._detect_pinch(left, 4, 8, left.get_hand_size())
-        right_pinch = self._detect_pinch(right, 4, 8, right.get_hand_size())
+        # Two-hand resize: both hands pinching, distance between them = size.
+        # Everything here works in squared space, so neither hand size ever
+        # needs a sqrt.
+        left_pinch = self._detect_pinch(
+            self._landmarks_xy(left), 4, 8,
+            self._pinch_threshold_sq * self._hand_size_sq(left))
+        right_pinch = self._detect_pinch(
+            self._landmarks_xy(right), 4, 8,
+            self._pinch_threshold_sq * self._hand_size_sq(right))
 
         if left_pinch and right_pinch:
             lc = left.get_palm_center()
@@ -265,27 +544,27 @@ class GestureRecognizer:
         current_time = time.time()
 
         if landmarks is None:
-            self.gesture_history.clear()
+            self._last_type = None
+            self._run_len = 0
             self.stable_gesture = None
             self.keyboard_mode_start = None
             self._prev_scroll_y = None
-            return GestureState(GestureType.IDLE, 0.0)
-
-        current = self._recognize_single_hand(landmarks)
-        self.gesture_history.append(current)
+            return GestureState(GestureType.IDLE, 0.0, timestamp=current_time)
 
-        if len(self.gesture_history) < self.stability_frames:
-            return None
+        current = self._recognize_single_hand(landmarks, current_time)
+        stable_type = current.gesture_type
+        if stable_type is self._last_type:
+            self._run_len += 1
+        else:
+            self._last_type = stable_type
+            self._run_len = 1
 
-        types = [g.gesture_type for g in self.gesture_history]
-        if len(set(types)) != 1:
+        if self._run_len < self.stability_frames:
             return None
 
-        stable_type = types[0]
-
         # Check cooldowns
-        if stable_type in (GestureType.LEFT_CLICK, GestureType.RIGHT_CLICK,
-                           GestureType.DOUBLE_CLICK):
+        is_click = (1 << stable_type) & self._CLICK_MASK
+        if is_click:
             if current_time - self.last_click_time < self.cooldown_click_ms / 1000.0:
                 return None
 
@@ -295,8 +574,7 @@ class GestureRecognizer:
 
         self.stable_gesture = current
 
-        if stable_type in (GestureType.LEFT_CLICK, GestureType.RIGHT_CLICK,
-                           GestureType.DOUBLE_CLICK):
+        if is_click:
             self.last_click_time = current_time
         elif stable_type == GestureType.SCROLL:
             self.last_scroll_time = current_time
@@ -304,7 +582,8 @@ class GestureRecognizer:
         return self.stable_gesture
 
     def reset(self) -> None:
-        self.gesture_history.clear()
+        self._last_type = None
+        self._run_len = 0
         self.stable_gesture = None
         self.last_click_time = 0.0
         self.last_scroll_time = 0.0
@@ -316,3 +595,56 @@ class GestureRecognizer:
         self._was_open_hand = False
         self._prev_two_hand_distance = None
         self._prev_scroll_y = None
+        self._size_sig = None
+
+
+class AsyncGestureRecognizer:
+    """Runs a GestureRecognizer on a dedicated worker thread.
+
+    The producer hands landmarks to submit() through a single-slot,
+    most-recent-wins buffer — the same freshest-frame policy as the
+    threaded camera — so the worker never burns time on stale frames.
+    latest() returns the most recent stable GestureState (a plain
+    reference swap, atomic under the GIL) without blocking either side.
+    """
+
+    def __init__(self, recognizer: GestureRecognizer):
+        self._inner = recognizer
+        self._cond = threading.Condition()
+        self._slot: Optional['HandLandmarks'] = None
+        self._has_frame = False
+        self._latest: Optional[GestureState] = None
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, landmarks: Optional['HandLandmarks']) -> None:
+        """Publish the newest landmarks, overwriting any unprocessed ones."""
+        with self._cond:
+            self._slot = landmarks
+            self._has_frame = True
+            self._cond.notify()
+
+    def latest(self) -> Optional[GestureState]:
+        """Most recent stable gesture produced by the worker, if any."""
+        return self._latest
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._has_frame and self._running:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                landmarks = self._slot
+                self._slot = None
+                self._has_frame = False
+            result = self._inner.process_landmarks(landmarks)
+            if result is not None:
+                self._latest = result
+
+    def close(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=1.0)
@@ -2,6 +2,7 @@
 Hand tracking module using MediaPipe Hands
 Supports two-hand tracking with handedness detection.
 """
+import math
 from typing import Optional, List, Tuple, NamedTuple, Dict
 import numpy as np
 
@@ -49,11 +50,64 @@ class HandLandmarks:
     PINKY_DIP = 19
     PINKY_TIP = 20
 
-    def __init__(self, landmarks: List[HandLandmark], handedness: str = "Right"):
-        if len(landmarks) != 21:
+    # Wrist + the four MCP knuckles, used for the palm-center average
+    _PALM_IDX = np.array([WRIST, INDEX_MCP, MIDDLE_MCP, RING_MCP, PINKY_MCP])
+
+    # One instance per hand per frame at 30+ FPS — no __dict__, just the
+    # fixed storage plus the per-frame memo fields
+    __slots__ = ('handedness', '_landmarks', '_array',
+                 '_hand_size', '_hand_size_sq', '_palm', '_mp_proto')
+
+    def __init__(self, landmarks: Optional[List[HandLandmark]] = None,
+                 handedness: str = "Right",
+                 array: Optional[np.ndarray] = None,
+                 mp_proto=None):
+        if landmarks is None and array is None:
+            raise ValueError("Need landmarks or an array")
+        if landmarks is not None and len(landmarks) != 21:
             raise ValueError(f"Expected 21 landmarks, got {len(landmarks)}")
-        self.landmarks = landmarks
+        if array is not None and array.shape != (21, 3):
+            raise ValueError(f"Expected a (21, 3) array, got {array.shape}")
+        self._landmarks = landmarks
         self.handedness = handedness  # "Right" or "Left"
+        self._array: Optional[np.ndarray] = array
+        self._hand_size: Optional[float] = None
+        self._hand_size_sq: Optional[float] = None
+        self._palm: Optional[Tuple[float, float]] = None
+        # Original MediaPipe NormalizedLandmarkList, kept so drawing can
+        # hand it back without rebuilding a landmark container
+        self._mp_proto = mp_proto
+
+    @property
+    def landmarks(self) -> List[HandLandmark]:
+        """NamedTuple view of the landmarks, materialized only when a
+        legacy caller asks — the hot path stays on the array."""
+        if self._landmarks is None:
+            self._landmarks = [HandLandmark(*row)
+                               for row in self._array.tolist()]
+        return self._landmarks
+
+    def as_array(self) -> np.ndarray:
+        """Landmarks as a contiguous (21, 3) float32 array, built once.
+
+        Hot-path consumers index this directly (e.g. ``arr[8, 0]`` for the
+        index fingertip x) instead of unpacking per-landmark tuples.
+        """
+        if self._array is None:
+            self._array = np.array(
+                [(lm.x, lm.y, lm.z) for lm in self.landmarks],
+                dtype=np.float32)
+        return self._array
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Landmark x coordinates as a float32 column view (SoA access)."""
+        return self.as_array()[:, 0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Landmark y coordinates as a float32 column view (SoA access)."""
+        return self.as_array()[:, 1]
 
     def __getitem__(self, index: int) -> HandLandmark:
         return self.landmarks[index]
@@ -69,19 +123,29 @@ class HandLandmarks:
             for lm in self.landmarks
         ]
 
+    def get_hand_size_sq(self) -> float:
+        """Squared wrist→middle-MCP distance — for threshold scaling that
+        works in squared space, so no sqrt is ever taken."""
+        if self._hand_size_sq is None:
+            arr = self.as_array()
+            dx = float(arr[self.MIDDLE_MCP, 0] - arr[self.WRIST, 0])
+            dy = float(arr[self.MIDDLE_MCP, 1] - arr[self.WRIST, 1])
+            self._hand_size_sq = dx * dx + dy * dy
+        return self._hand_size_sq
+
     def get_hand_size(self) -> float:
-        wrist = self.landmarks[self.WRIST]
-        middle_mcp = self.landmarks[self.MIDDLE_MCP]
-        dx = middle_mcp.x - wrist.x
-        dy = middle_mcp.y - wrist.y
-        return np.sqrt(dx * dx + dy * dy)
+        # Landmarks are immutable after construction, so the sqrt runs at
+        # most once per frame no matter how often the recognizer asks
+        if self._hand_size is None:
+            self._hand_size = math.sqrt(self.get_hand_size_sq())
+        return self._hand_size
 
     def get_palm_center(self) -> Tuple[float, float]:
-        """Average of wrist and all MCP joints."""
-        indices = [0, 5, 9, 13, 17]
-        xs = [self.landmarks[i].x for i in indices]
-        ys = [self.landmarks[i].y for i in indices]
-        return (sum(xs) / len(xs), sum(ys) / len(ys))
+        """Average of wrist and all MCP joints, computed once per frame."""
+        if self._palm is None:
+            palm = self.as_array()[self._PALM_IDX]
+            self._palm = (float(palm[:, 0].mean()), float(palm[:, 1].mean()))
+        return self._palm
 
 
 class HandTrackingResult:
@@ -114,7 +178,8 @@ class HandTracker:
                  min_detection_confidence: float = 0.8,
                  min_tracking_confidence: float = 0.7,
                  static_image_mode: bool = False,
-                 model_complexity: int = 1):
+                 model_complexity: int = 1,
+                 color: str = 'BGR'):
         if not MEDIAPIPE_AVAILABLE:
             raise ImportError("MediaPipe is not available")
         if not CV2_AVAILABLE:
@@ -132,13 +197,28 @@ class HandTracker:
             model_complexity=model_complexity,
         )
 
+        # 'RGB' skips the per-frame channel swap entirely — pair with
+        # Camera(color='RGB') when no BGR preview is needed
+        self.color = color
+        self._rgb_buf: Optional[np.ndarray] = None
+
     def process_frame(self, frame: np.ndarray) -> HandTrackingResult:
         """Process a frame and return all detected hands with handedness."""
         result = HandTrackingResult()
 
-        # Don't copy — just set writable flag for performance
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        rgb_frame.flags.writeable = False
+        if self.color == 'RGB':
+            # Producer already delivers RGB — nothing to convert. Leave
+            # the caller's flags alone.
+            rgb_frame = frame
+        else:
+            # Convert into one preallocated buffer instead of letting
+            # cvtColor malloc a ~frame-sized array every call
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            self._rgb_buf.flags.writeable = True
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            rgb_frame = self._rgb_buf
+            rgb_frame.flags.writeable = False
         mp_results = self.hands.process(rgb_frame)
 
         if mp_results.multi_hand_landmarks and mp_results.multi_handedness:
@@ -149,11 +229,14 @@ class HandTracker:
                 # MediaPipe reports handedness from camera's perspective
                 # Since we mirror, "Right" in MP = user's right hand
                 handedness = hand_info.classification[0].label
-                landmarks = [
-                    HandLandmark(x=lm.x, y=lm.y, z=lm.z)
-                    for lm in hand_lms.landmark
-                ]
-                result.hands.append(HandLandmarks(landmarks, handedness))
+                # One pass over the protobuf straight into the (21, 3)
+                # array; NamedTuples only exist if a legacy caller asks
+                array = np.array(
+                    [(lm.x, lm.y, lm.z) for lm in hand_lms.landmark],
+                    dtype=np.float32)
+                result.hands.append(
+                    HandLandmarks(handedness=handedness, array=array,
+                                  mp_proto=hand_lms))
 
         return result
 
@@ -161,12 +244,16 @@ class HandTracker:
                        hand_landmarks: HandLandmarks,
                        color: Optional[Tuple[int, int, int]] = None) -> np.ndarray:
         """Draw hand landmarks on frame."""
-        mp_landmarks = type('MockLandmarks', (), {})()
-        mp_landmarks.landmark = []
-        for lm in hand_landmarks.landmarks:
-            ml = type('MockLandmark', (), {})()
-            ml.x, ml.y, ml.z = lm.x, lm.y, lm.z
-            mp_landmarks.landmark.append(ml)
+        mp_landmarks = getattr(hand_landmarks, '_mp_proto', None)
+        if mp_landmarks is None:
+            # Hands built outside process_frame (tests, replays) carry no
+            # protobuf — fall back to a throwaway duck-typed container
+            mp_landmarks = type('MockLandmarks', (), {})()
+            mp_landmarks.landmark = []
+            for lm in hand_landmarks.landmarks:
+                ml = type('MockLandmark', (), {})()
+                ml.x, ml.y, ml.z = lm.x, lm.y, lm.z
+                mp_landmarks.landmark.append(ml)
 
         if color:
             landmark_style = self.mp_drawing.DrawingSpec(color=color, thickness=2, circle_radius=2)
@@ -40,6 +40,8 @@ class HandControlApp:
             fps_target=cam_cfg.get('fps_target', 30),
             mirror=cam_cfg.get('mirror', True),
             use_threading=True,
+            backend=cam_cfg.get('backend'),
+            track_fps=self.config.get('display.show_fps', True),
         )
 
         # Hand tracker
@@ -97,6 +99,10 @@ class HandControlApp:
         self.keyboard_feedback_message = ""
         self.is_macos = platform.system() == 'Darwin'
 
+        # Monotonic time of the most recent camera frame, threaded through
+        # to the cursor smoother so it never queries the clock itself
+        self._frame_timestamp: Optional[float] = None
+
         # FPS tracking
         self._frame_count = 0
         self._fps_time = time.time()
@@ -126,7 +132,8 @@ class HandControlApp:
         if gt == GestureType.MOVE:
             pos = data.get('cursor_pos')
             if pos:
-                self.cursor_controller.move_cursor(pos[0], pos[1])
+                self.cursor_controller.move_cursor(pos[0], pos[1],
+                                                   self._frame_timestamp)
 
         elif gt == GestureType.LEFT_CLICK:
             if self._can_click():
@@ -195,7 +202,7 @@ class HandControlApp:
         h, w = frame.shape[:2]
 
         # Status bar
-        status = f"{'PAUSED' if self.is_paused else gesture_type.value.upper()}"
+        status = f"{'PAUSED' if self.is_paused else gesture_type.name}"
         fps_text = f"FPS: {self._current_fps:.0f}"
 
         cv2.rectangle(frame, (0, 0), (w, 35), (20, 20, 20), -1)
@@ -217,6 +224,7 @@ class HandControlApp:
                 if not success or frame is None:
                     time.sleep(0.001)
                     continue
+                self._frame_timestamp = time.perf_counter_ns() * 1e-9
 
                 self._update_fps()
                 current_gesture_type = GestureType.IDLE
@@ -7,8 +7,65 @@ import math
 from typing import Optional, Tuple
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _one_euro_step(state, x, y, t, freq, mincutoff, beta, dcutoff):
+        """Fused x/y One-Euro update on a small state vector.
+
+        state layout: [initialized, prev_t, prev_x, prev_y,
+                       dx_smooth, dy_smooth, filters_initialized]
+        Matches OneEuroFilter.filter step for step, including the
+        pass-through behavior of the first two samples.
+        """
+        if state[0] == 0.0:
+            state[0] = 1.0
+            state[1] = t
+            state[2] = x
+            state[3] = y
+            return x, y
+        dt = t - state[1]
+        if dt <= 0.0:
+            dt = 1.0 / freq
+        two_pi_dt = 2.0 * np.pi * dt
+        dx = (x - state[2]) / dt
+        dy = (y - state[3]) / dt
+        if state[6] == 0.0:
+            state[6] = 1.0
+            rx, ry = x, y
+            state[4], state[5] = dx, dy
+        else:
+            a_d = 1.0 / (1.0 + 1.0 / (two_pi_dt * dcutoff))
+            dxs = a_d * dx + (1.0 - a_d) * state[4]
+            dys = a_d * dy + (1.0 - a_d) * state[5]
+            state[4], state[5] = dxs, dys
+            a_x = 1.0 / (1.0 + 1.0 / (two_pi_dt * (mincutoff + beta * abs(dxs))))
+            a_y = 1.0 / (1.0 + 1.0 / (two_pi_dt * (mincutoff + beta * abs(dys))))
+            rx = a_x * x + (1.0 - a_x) * state[2]
+            ry = a_y * y + (1.0 - a_y) * state[3]
+        state[1] = t
+        state[2], state[3] = rx, ry
+        return rx, ry
+
+    @njit(cache=True, fastmath=True)
+    def _one_euro_batch(state, xs, ys, ts, freq, mincutoff, beta, dcutoff,
+                        out_x, out_y):
+        for i in range(xs.shape[0]):
+            out_x[i], out_y[i] = _one_euro_step(
+                state, xs[i], ys[i], ts[i], freq, mincutoff, beta, dcutoff)
+
 
 class Smoother(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def filter(self, value: float, timestamp: Optional[float] = None) -> float:
         pass
@@ -19,6 +76,8 @@ class Smoother(ABC):
 
 
 class LowPassFilter:
+    __slots__ = ('alpha', 'prev_output')
+
     def __init__(self, alpha: float = 0.1):
         self.alpha = max(0.0, min(1.0, alpha))
         self.prev_output: Optional[float] = None
@@ -47,6 +106,9 @@ class OneEuroFilter(Smoother):
     - Result: elastic feel, smooth but responsive
     """
 
+    __slots__ = ('freq', 'mincutoff', 'beta', 'dcutoff',
+                 'x_filter', 'dx_filter', 'prev_time', 'prev_value')
+
     def __init__(self,
                  freq: float = 60.0,
                  mincutoff: float = 0.3,
@@ -67,7 +129,10 @@ class OneEuroFilter(Smoother):
 
     def filter(self, value: float, timestamp: Optional[float] = None) -> float:
         if timestamp is None:
-            timestamp = time.time()
+            # perf_counter_ns is monotonic with ns resolution — dt can never
+            # go negative on wall-clock adjustments, and the integer read is
+            # exact before the single float conversion
+            timestamp = time.perf_counter_ns() * 1e-9
 
         if self.prev_time is None or self.prev_value is None:
             self.prev_time = timestamp
@@ -98,6 +163,8 @@ class OneEuroFilter(Smoother):
 
 
 class EMAFilter(Smoother):
+    __slots__ = ('alpha', 'prev_value')
+
     def __init__(self, alpha: float = 0.3):
         self.alpha = max(0.0, min(1.0, alpha))
         self.prev_value: Optional[float] = None
@@ -116,25 +183,70 @@ class EMAFilter(Smoother):
 class PointSmoother:
     """2D point smoother using separate X and Y filters"""
 
+    __slots__ = ('smoother_type', 'x_smoother', 'y_smoother',
+                 '_use_jit', '_params', '_state')
+
     def __init__(self, smoother_type: str = 'one_euro', **kwargs):
         self.smoother_type = smoother_type
+        self._use_jit = False
         if smoother_type == 'one_euro':
             self.x_smoother = OneEuroFilter(**kwargs)
             self.y_smoother = OneEuroFilter(**kwargs)
+            if NUMBA_AVAILABLE:
+                # Jitted fused kernel replaces per-axis Python filters on
+                # the per-frame path; warm up once so the compile cost is
+                # paid here rather than on the first cursor move.
+                f = self.x_smoother
+                self._params = (f.freq, f.mincutoff, f.beta, f.dcutoff)
+                self._state = np.zeros(7)
+                _one_euro_step(np.zeros(7), 0.0, 0.0, 0.0, *self._params)
+                self._use_jit = True
         elif smoother_type == 'ema':
             self.x_smoother = EMAFilter(**kwargs)
             self.y_smoother = EMAFilter(**kwargs)
         else:
             raise ValueError(f"Unknown smoother type: {smoother_type}")
 
-    def filter(self, point: Tuple[float, float],
-               timestamp: Optional[float] = None) -> Tuple[float, float]:
-        x, y = point
+    def filter_xy(self, x: float, y: float,
+                  timestamp: Optional[float] = None) -> Tuple[float, float]:
+        """Scalar hot-path variant of filter() — no input tuple to pack."""
+        if self._use_jit:
+            if timestamp is None:
+                timestamp = time.perf_counter_ns() * 1e-9
+            return _one_euro_step(self._state, x, y, timestamp, *self._params)
         return (
             self.x_smoother.filter(x, timestamp),
             self.y_smoother.filter(y, timestamp),
         )
 
+    def filter(self, point: Tuple[float, float],
+               timestamp: Optional[float] = None) -> Tuple[float, float]:
+        x, y = point
+        return self.filter_xy(x, y, timestamp)
+
+    def filter_batch(self, xs, ys, ts) -> Tuple[np.ndarray, np.ndarray]:
+        """Filter whole sample traces, returning smoothed (xs, ys) arrays.
+
+        The recurrence is inherently sequential, so this runs the scalar
+        step in a loop; with numba installed the whole loop executes as one
+        native kernel call. Intended for tests and offline trace analysis
+        rather than the per-frame path.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        ts = np.asarray(ts, dtype=np.float64)
+        out_x = np.empty_like(xs)
+        out_y = np.empty_like(ys)
+        if self._use_jit:
+            _one_euro_batch(self._state, xs, ys, ts, *self._params,
+                            out_x, out_y)
+        else:
+            for i in range(xs.shape[0]):
+                out_x[i], out_y[i] = self.filter_xy(xs[i], ys[i], ts[i])
+        return out_x, out_y
+
     def reset(self) -> None:
+        if self._use_jit:
+            self._state[:] = 0.0
         self.x_smoother.reset()
         self.y_smoother.reset()
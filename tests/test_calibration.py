@@ -116,6 +116,24 @@ def test_perspective_transform():
     assert abs(my - 0.5) < 0.05
 
 
+@pytest.mark.skipif(not __import__('importlib').util.find_spec('cv2'), reason="no cv2")
+def test_map_points_batch():
+    """map_points should agree with per-point map_point."""
+    import numpy as np
+    c = ScreenCalibrator(1920, 1080)
+    c.start_calibration()
+    for x, y in [(0.1, 0.1), (0.9, 0.1), (0.9, 0.9), (0.1, 0.9), (0.5, 0.5)]:
+        c.capture_point(x, y)
+
+    pts = np.array([[0.2, 0.3], [0.5, 0.5], [0.8, 0.7]])
+    mapped = c.map_points(pts)
+    assert mapped.shape == (3, 2)
+    for (cx, cy), (mx, my) in zip(pts, mapped):
+        sx, sy = c.map_point(cx, cy)
+        assert abs(mx - sx) < 1e-4
+        assert abs(my - sy) < 1e-4
+
+
 def test_recalibrate_detection():
     c = ScreenCalibrator()
     c.calibration_hand_size = 0.1
@@ -46,6 +46,40 @@ def test_load_override(temp_dir):
     assert c.get('camera.width') == 640
 
 
+def test_cache_sidecar(temp_dir):
+    override = {'camera': {'fps_target': 90}}
+    path = os.path.join(temp_dir, 'cached.yaml')
+    with open(path, 'w') as f:
+        yaml.dump(override, f)
+
+    # First load writes the sidecar cache
+    c1 = Config(path)
+    assert c1.get('camera.fps_target') == 90
+    assert os.path.exists(path + '.cache')
+
+    # Second load comes from the cache and sees the same values
+    c2 = Config(path)
+    assert c2.get('camera.fps_target') == 90
+
+
+def test_get_ref():
+    c = Config()
+    ref = c.get_ref('camera.fps_target')
+    assert ref() == 30
+    c.set('camera.fps_target', 60)
+    assert ref() == 60
+
+
+def test_frozen_view():
+    c = Config()
+    assert c.frozen.camera.fps_target == 30
+    c.set('camera.fps_target', 60)
+    # View is rebuilt after set()
+    assert c.frozen.camera.fps_target == 60
+    # Non-identifier keys (shortcut tables) stay plain dicts
+    assert c.frozen.keyboard_shortcuts.shortcuts['1_finger'] == 'escape'
+
+
 def test_platform_auto():
     import sys
     c = Config()
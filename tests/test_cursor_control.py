@@ -20,6 +20,19 @@ def test_webcam_to_screen_center(mock_pyautogui):
     assert abs(sy - 540) < 5
 
 
+def test_webcam_to_screen_batch(mock_pyautogui):
+    import numpy as np
+    from cursor_control import CursorController
+    c = CursorController(Config())
+    pts = np.array([[0.2, 0.3], [0.5, 0.5], [0.8, 0.7]])
+    batch = c.webcam_to_screen_batch(pts)
+    assert batch.shape == (3, 2)
+    for (nx, ny), (bx, by) in zip(pts, batch):
+        sx, sy = c.webcam_to_screen(nx, ny)
+        assert abs(bx - sx) < 1e-2
+        assert abs(by - sy) < 1e-2
+
+
 def test_move_cursor(mock_pyautogui):
     from cursor_control import CursorController
     c = CursorController(Config())
@@ -27,6 +40,16 @@ def test_move_cursor(mock_pyautogui):
     mock_pyautogui['move'].assert_called_once()
 
 
+def test_subpixel_move_skipped(mock_pyautogui):
+    from cursor_control import CursorController
+    c = CursorController(Config())
+    c.move_cursor(0.5, 0.5)
+    # Same target again — smoothed position lands on the same pixel, so no
+    # second OS move is issued
+    c.move_cursor(0.5, 0.5)
+    assert mock_pyautogui['move'].call_count == 1
+
+
 def test_click_actions(mock_pyautogui):
     from cursor_control import CursorController
     c = CursorController(Config())
@@ -41,6 +41,18 @@ class TestSingleHandGestures:
         g = r._recognize_single_hand(fist_hand)
         assert g.gesture_type == GestureType.GRAB
 
+    def test_recognize_batch(self, move_hand, pinch_hand, fist_hand):
+        import numpy as np
+        r = GestureRecognizer(stability_frames=1)
+        frames = np.stack([r._landmarks_xy(move_hand),
+                           r._landmarks_xy(pinch_hand),
+                           r._landmarks_xy(fist_hand)])
+        codes = r.recognize_batch(frames)
+        types = [r.BATCH_GESTURES[c] for c in codes]
+        assert types[0] == GestureType.MOVE
+        assert types[1] == GestureType.LEFT_CLICK
+        assert types[2] == GestureType.IDLE
+
     def test_stability_mechanism(self, move_hand):
         r = GestureRecognizer(stability_frames=2)
         r.process_landmarks(move_hand)
@@ -66,10 +78,26 @@ class TestSingleHandGestures:
         r = GestureRecognizer(stability_frames=2)
         r.process_landmarks(move_hand)
         r.reset()
-        assert len(r.gesture_history) == 0
+        assert r._run_len == 0
         assert r.stable_gesture is None
 
 
+class TestAsyncRecognizer:
+    def test_async_latest_gesture(self, move_hand):
+        from gesture_recognition import AsyncGestureRecognizer
+        r = AsyncGestureRecognizer(GestureRecognizer(stability_frames=1))
+        try:
+            deadline = time.time() + 1.0
+            while r.latest() is None and time.time() < deadline:
+                r.submit(move_hand)
+                time.sleep(0.005)
+            g = r.latest()
+            assert g is not None
+            assert g.gesture_type == GestureType.MOVE
+        finally:
+            r.close()
+
+
 class TestTwoHandGestures:
     def test_no_two_hand_with_one(self, move_hand):
         from hand_tracker import HandTrackingResult
@@ -114,6 +114,34 @@ def test_alpha_clamping():
     assert EMAFilter(alpha=-0.1).alpha == 0.0
 
 
+def test_filter_batch_jitter_reduction():
+    from smoothing import PointSmoother
+    s = PointSmoother('one_euro', freq=30, mincutoff=0.1, beta=0.001)
+    rng = np.random.default_rng(42)
+    n = 2000
+    ts = np.arange(n) * (1.0 / 30.0)
+    xs = 10.0 + rng.normal(0, 0.2, n)
+    ys = 5.0 + rng.normal(0, 0.2, n)
+    out_x, out_y = s.filter_batch(xs, ys, ts)
+    assert out_x.shape == (n,)
+    assert np.var(out_x) < np.var(xs)
+    assert np.var(out_y) < np.var(ys)
+
+
+def test_filter_batch_matches_scalar():
+    from smoothing import PointSmoother
+    a = PointSmoother('one_euro', freq=30)
+    b = PointSmoother('one_euro', freq=30)
+    ts = np.arange(20) * (1.0 / 30.0)
+    xs = np.sin(ts * 3.0)
+    ys = np.cos(ts * 3.0)
+    out_x, out_y = a.filter_batch(xs, ys, ts)
+    for i in range(20):
+        sx, sy = b.filter_xy(xs[i], ys[i], ts[i])
+        assert abs(out_x[i] - sx) < 1e-9
+        assert abs(out_y[i] - sy) < 1e-9
+
+
 def test_smoothing_performance():
     """1000 filter calls should complete in <100ms."""
     from smoothing import OneEuroFilter